@@ -1,6 +1,6 @@
-%module jamspell
+%module(threads="1") jamspell
+%nothread;
 %include "std_vector.i"
-%include "pyabc.i"
 %include <std_list.i>
 %include <std_string.i>
 %include <std_wstring.i>
@@ -11,10 +11,242 @@
 
 //TScoredWords = vector<TScoredWord>;
 
+// std::vector::clear keeps the buffer allocated, swap with an empty vector
+// to actually free it; the old behaviour stays available for hot loops
+%rename(clear_keep_capacity) std::vector<std::wstring>::clear;
+%rename(clear) std::vector<std::wstring>::free_clear;
+%extend std::vector<std::wstring> {
+    void free_clear() {
+        std::vector<std::wstring>().swap(*$self);
+    }
+}
+
+// StringVector(list_or_tuple): the default conversion builds a temporary vector
+// element by element and then copies it; size is known up front, so reserve and fill
+%typemap(in) PyObject* items "$1 = $input;"
+%typemap(typecheck, precedence=0) PyObject* items {
+    $1 = (PyList_Check($input) || PyTuple_Check($input)) ? 1 : 0;
+}
+%exception std::vector<std::wstring>::vector(PyObject* items) {
+    try {
+        $action
+    } catch (const std::invalid_argument& e) {
+        SWIG_exception(SWIG_TypeError, e.what());
+    }
+}
+%extend std::vector<std::wstring> {
+    vector(PyObject* items) {
+        Py_ssize_t size = PySequence_Fast_GET_SIZE(items);
+        std::unique_ptr<std::vector<std::wstring>> result(new std::vector<std::wstring>());
+        result->reserve(size);
+        for (Py_ssize_t i = 0; i < size; ++i) {
+            std::wstring item;
+            if (!SWIG_IsOK(SWIG_AsVal_std_wstring(PySequence_Fast_GET_ITEM(items, i), &item))) {
+                throw std::invalid_argument("StringVector items must be str");
+            }
+            result->push_back(std::move(item));
+        }
+        return result.release();
+    }
+}
+
+// proxies only ever hold the swig pointer, don't give every instance a __dict__
+%extend swig::SwigPyIterator {
+%pythoncode %{
+    __slots__ = ('this',)
+%}
+}
+%extend std::vector<std::wstring> {
+%pythoncode %{
+    __slots__ = ('this',)
+%}
+}
+
 // Instantiate templates used by example
 namespace std {
    %template(StringVector) vector<wstring>;
 }
 
+// bytes overloads for callers that already hold utf-8: read straight from the
+// bytes object and hand the result back as bytes, no str round trip in python
+%typemap(in) (const char* text, size_t len) {
+    char* buf = 0;
+    Py_ssize_t size = 0;
+    if (PyBytes_AsStringAndSize($input, &buf, &size) == -1) {
+        SWIG_fail;
+    }
+    $1 = buf;
+    $2 = static_cast<size_t>(size);
+}
+%typemap(out) std::string FixFragment, std::string FixFragmentNormalized {
+    $result = PyBytes_FromStringAndSize($1.data(), $1.size());
+}
+%rename(FixFragmentBytes) NJamSpell::TSpellCorrector::FixFragment(const char*, size_t) const;
+%rename(FixFragmentNormalizedBytes) NJamSpell::TSpellCorrector::FixFragmentNormalized(const char*, size_t) const;
+
+%pythoncode %{
+# threading and namedtuple would pull in collections on import, keep to the builtin _thread
+import _thread
+
+FRAGMENT_CACHE_SIZE = 4096
+
+class CacheInfo(tuple):
+    """(hits, misses, maxsize, currsize), same fields as functools.lru_cache's cache_info()."""
+
+    __slots__ = ()
+
+    def __new__(cls, hits, misses, maxsize, currsize):
+        return tuple.__new__(cls, (hits, misses, maxsize, currsize))
+
+    hits = property(lambda self: self[0])
+    misses = property(lambda self: self[1])
+    maxsize = property(lambda self: self[2])
+    currsize = property(lambda self: self[3])
+
+    def __repr__(self):
+        return 'CacheInfo(hits=%r, misses=%r, maxsize=%r, currsize=%r)' % self
+
+class _FragmentCache(object):
+    """Thread-safe LRU of corrected fragments, same semantics as functools.lru_cache."""
+
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.data = {}
+        self.generation = 0
+        self.lock = _thread.allocate_lock()
+
+    def get(self, key, compute):
+        if self.maxsize == 0:
+            return compute()
+        with self.lock:
+            if key in self.data:
+                self.hits += 1
+                result = self.data.pop(key)
+                self.data[key] = result
+                return result
+            self.misses += 1
+            generation = self.generation
+        result = compute()
+        with self.lock:
+            # a reload cleared the cache while this result was computed with the old model
+            if generation != self.generation:
+                return result
+            self.data[key] = result
+            if self.maxsize is not None and len(self.data) > self.maxsize:
+                del self.data[next(iter(self.data))]
+        return result
+
+    def info(self):
+        with self.lock:
+            return CacheInfo(self.hits, self.misses, self.maxsize, len(self.data))
+
+    def clear(self):
+        with self.lock:
+            self.data.clear()
+            self.generation += 1
+            self.hits = 0
+            self.misses = 0
+%}
+
+// repeated str fragments are answered from the per-corrector cache
+%feature("shadow") NJamSpell::TSpellCorrector::FixFragment(const std::wstring&) const %{
+    def FixFragment(self, text, _f=$action):
+        return self._fragmentCache.get(('FixFragment', text), lambda: _f(self, text))
+%}
+%feature("shadow") NJamSpell::TSpellCorrector::FixFragmentNormalized(const std::wstring&) const %{
+    def FixFragmentNormalized(self, text, _f=$action):
+        return self._fragmentCache.get(('FixFragmentNormalized', text), lambda: _f(self, text))
+%}
+
+// hot pass-through methods bind their C wrapper once as a default argument
+// rather than looking up _jamspell.<name> on every call
+%feature("shadow") NJamSpell::TSpellCorrector::FixFragment(const char*, size_t) const %{
+    def FixFragmentBytes(self, text, _f=$action):
+        return _f(self, text)
+%}
+%feature("shadow") NJamSpell::TSpellCorrector::FixFragmentNormalized(const char*, size_t) const %{
+    def FixFragmentNormalizedBytes(self, text, _f=$action):
+        return _f(self, text)
+%}
+%feature("shadow") NJamSpell::TSpellCorrector::FixFragments %{
+    def FixFragments(self, texts, _f=$action):
+        return _f(self, texts)
+%}
+%feature("shadow") NJamSpell::TSpellCorrector::GetCandidates %{
+    def GetCandidates(self, sentence, position, _f=$action):
+        return _f(self, sentence, position)
+%}
+%feature("shadow") NJamSpell::TSpellCorrector::GetCandidatesScored %{
+    def GetCandidatesScored(self, sentence, position, _f=$action):
+        return _f(self, sentence, position)
+%}
+%feature("shadow") NJamSpell::TSpellCorrector::GetCandidatesTrie %{
+    def GetCandidatesTrie(self, word, maxDist, _f=$action):
+        return _f(self, word, maxDist)
+%}
+
+// the cache exists from construction on, so threads sharing a corrector never race to create it
+%pythonappend NJamSpell::TSpellCorrector::TSpellCorrector "self._fragmentCache = _FragmentCache(FRAGMENT_CACHE_SIZE)"
+
+// cached fragments are only valid for the model and settings they were made with
+%pythonappend NJamSpell::TSpellCorrector::LoadLangModel "self.cache_clear()"
+%pythonappend NJamSpell::TSpellCorrector::LoadLangModelMmap "self.cache_clear()"
+%pythonappend NJamSpell::TSpellCorrector::TrainLangModel "self.cache_clear()"
+%pythonappend NJamSpell::TSpellCorrector::SetPenalty "self.cache_clear()"
+%pythonappend NJamSpell::TSpellCorrector::SetMaxCandidatesToCheck "self.cache_clear()"
+
+// the json is plain utf-8 and usually goes straight into json.loads, which takes bytes,
+// so skip decoding it into a str on the way out
+%typemap(out) std::string GetALLCandidatesScoredJSON {
+    $result = PyBytes_FromStringAndSize($1.data(), $1.size());
+}
+%rename(GetALLCandidatesScoredJSONBytes) NJamSpell::TSpellCorrector::GetALLCandidatesScoredJSON;
+%extend NJamSpell::TSpellCorrector {
+%pythoncode %{
+    __slots__ = ('this', '_fragmentCache')
+
+    def GetALLCandidatesScoredJSON(self, text):
+        return self.GetALLCandidatesScoredJSONBytes(text).decode('utf-8')
+
+    def cache_info(self):
+        return self._fragmentCache.info()
+
+    def cache_clear(self):
+        self._fragmentCache.clear()
+%}
+}
+
+// the gil is held by default (%nothread above); the long running, pure C++ calls below let
+// other python threads run while they work (arguments are converted before
+// and results after the call, with the gil held). TSpellCorrector's own
+// read/write lock keeps reloads from running under concurrent queries.
+%thread NJamSpell::TSpellCorrector::LoadLangModel;
+%thread NJamSpell::TSpellCorrector::TrainLangModel;
+%thread NJamSpell::TSpellCorrector::LoadLangModelMmap;
+%thread NJamSpell::TSpellCorrector::SaveLangModelMmap;
+%thread NJamSpell::TSpellCorrector::GetALLCandidatesScoredJSON;
+%thread NJamSpell::TSpellCorrector::GetCandidatesScored;
+%thread NJamSpell::TSpellCorrector::GetCandidates;
+%thread NJamSpell::TSpellCorrector::GetCandidatesTrie;
+%thread NJamSpell::TSpellCorrector::FixFragment;
+%thread NJamSpell::TSpellCorrector::FixFragmentNormalized;
+%thread NJamSpell::TSpellCorrector::FixFragments;
+
+// an escaping C++ exception would abort the interpreter, raise it in python instead
+%exception {
+    try {
+        $action
+    } catch (const std::bad_alloc&) {
+        SWIG_exception(SWIG_MemoryError, "out of memory");
+    } catch (const std::range_error& e) {
+        // utf-8 <-> wide conversion of malformed text
+        SWIG_exception(SWIG_ValueError, e.what());
+    } catch (const std::exception& e) {
+        SWIG_exception(SWIG_RuntimeError, e.what());
+    }
+}
+
 %include "jamspell/spell_corrector.hpp"
-#include "jamspell/utils.hpp"
\ No newline at end of file
+#include "jamspell/utils.hpp"
@@ -1,111 +1,70 @@
-# This file was automatically generated by SWIG (http://www.swig.org).
-# Version 3.0.12
+# This file was automatically generated by SWIG (https://www.swig.org).
+# Version 4.2.1
 #
-# Do not make changes to this file unless you know what you are doing--modify
+# Do not make changes to this file unless you know what you are doing - modify
 # the SWIG interface file instead.
 
 from sys import version_info as _swig_python_version_info
-if _swig_python_version_info >= (2, 7, 0):
-    def swig_import_helper():
-        import importlib
-        pkg = __name__.rpartition('.')[0]
-        mname = '.'.join((pkg, '_jamspell')).lstrip('.')
-        try:
-            return importlib.import_module(mname)
-        except ImportError:
-            return importlib.import_module('_jamspell')
-    _jamspell = swig_import_helper()
-    del swig_import_helper
-elif _swig_python_version_info >= (2, 6, 0):
-    def swig_import_helper():
-        from os.path import dirname
-        import imp
-        fp = None
-        try:
-            fp, pathname, description = imp.find_module('_jamspell', [dirname(__file__)])
-        except ImportError:
-            import _jamspell
-            return _jamspell
-        try:
-            _mod = imp.load_module('_jamspell', fp, pathname, description)
-        finally:
-            if fp is not None:
-                fp.close()
-        return _mod
-    _jamspell = swig_import_helper()
-    del swig_import_helper
+# Import the low-level C/C++ module
+if __package__ or "." in __name__:
+    from . import _jamspell
 else:
     import _jamspell
-del _swig_python_version_info
-
-try:
-    _swig_property = property
-except NameError:
-    pass  # Python < 2.2 doesn't have 'property'.
 
 try:
     import builtins as __builtin__
 except ImportError:
     import __builtin__
 
-def _swig_setattr_nondynamic(self, class_type, name, value, static=1):
-    if (name == "thisown"):
-        return self.this.own(value)
-    if (name == "this"):
-        if type(value).__name__ == 'SwigPyObject':
-            self.__dict__[name] = value
-            return
-    method = class_type.__swig_setmethods__.get(name, None)
-    if method:
-        return method(self, value)
-    if (not static):
-        if _newclass:
-            object.__setattr__(self, name, value)
+def _swig_repr(self):
+    try:
+        strthis = "proxy of " + self.this.__repr__()
+    except __builtin__.Exception:
+        strthis = ""
+    return "<%s.%s; %s >" % (self.__class__.__module__, self.__class__.__name__, strthis,)
+
+
+def _swig_setattr_nondynamic_instance_variable(set):
+    def set_instance_attr(self, name, value):
+        if name == "this":
+            set(self, name, value)
+        elif name == "thisown":
+            self.this.own(value)
+        elif hasattr(self, name) and isinstance(getattr(type(self), name), property):
+            set(self, name, value)
         else:
-            self.__dict__[name] = value
-    else:
-        raise AttributeError("You cannot add attributes to %s" % self)
+            raise AttributeError("You cannot add instance attributes to %s" % self)
+    return set_instance_attr
 
 
-def _swig_setattr(self, class_type, name, value):
-    return _swig_setattr_nondynamic(self, class_type, name, value, 0)
+def _swig_setattr_nondynamic_class_variable(set):
+    def set_class_attr(cls, name, value):
+        if hasattr(cls, name) and not isinstance(getattr(cls, name), property):
+            set(cls, name, value)
+        else:
+            raise AttributeError("You cannot add class attributes to %s" % cls)
+    return set_class_attr
 
 
-def _swig_getattr(self, class_type, name):
-    if (name == "thisown"):
-        return self.this.own()
-    method = class_type.__swig_getmethods__.get(name, None)
-    if method:
-        return method(self)
-    raise AttributeError("'%s' object has no attribute '%s'" % (class_type.__name__, name))
+def _swig_add_metaclass(metaclass):
+    """Class decorator for adding a metaclass to a SWIG wrapped class - a slimmed down version of six.add_metaclass"""
+    def wrapper(cls):
+        return metaclass(cls.__name__, cls.__bases__, cls.__dict__.copy())
+    return wrapper
 
 
-def _swig_repr(self):
-    try:
-        strthis = "proxy of " + self.this.__repr__()
-    except __builtin__.Exception:
-        strthis = ""
-    return "<%s.%s; %s >" % (self.__class__.__module__, self.__class__.__name__, strthis,)
+class _SwigNonDynamicMeta(type):
+    """Meta class to enforce nondynamic attributes (no new attributes) for a class"""
+    __setattr__ = _swig_setattr_nondynamic_class_variable(type.__setattr__)
 
-try:
-    _object = object
-    _newclass = 1
-except __builtin__.Exception:
-    class _object:
-        pass
-    _newclass = 0
-
-class SwigPyIterator(_object):
-    __swig_setmethods__ = {}
-    __setattr__ = lambda self, name, value: _swig_setattr(self, SwigPyIterator, name, value)
-    __swig_getmethods__ = {}
-    __getattr__ = lambda self, name: _swig_getattr(self, SwigPyIterator, name)
+
+class SwigPyIterator(object):
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
 
     def __init__(self, *args, **kwargs):
         raise AttributeError("No constructor defined - class is abstract")
     __repr__ = _swig_repr
     __swig_destroy__ = _jamspell.delete_SwigPyIterator
-    __del__ = lambda self: None
 
     def value(self):
         return _jamspell.SwigPyIterator_value(self)
@@ -156,15 +115,14 @@ class SwigPyIterator(_object):
         return _jamspell.SwigPyIterator___sub__(self, *args)
     def __iter__(self):
         return self
-SwigPyIterator_swigregister = _jamspell.SwigPyIterator_swigregister
-SwigPyIterator_swigregister(SwigPyIterator)
-
-import collections
-class StringVector(_object):
-    __swig_setmethods__ = {}
-    __setattr__ = lambda self, name, value: _swig_setattr(self, StringVector, name, value)
-    __swig_getmethods__ = {}
-    __getattr__ = lambda self, name: _swig_getattr(self, StringVector, name)
+
+    __slots__ = ('this',)
+
+
+# Register SwigPyIterator in _jamspell:
+_jamspell.SwigPyIterator_swigregister(SwigPyIterator)
+class StringVector(object):
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
     __repr__ = _swig_repr
 
     def iterator(self):
@@ -226,8 +184,8 @@ class StringVector(_object):
     def rend(self):
         return _jamspell.StringVector_rend(self)
 
-    def clear(self):
-        return _jamspell.StringVector_clear(self)
+    def clear_keep_capacity(self):
+        return _jamspell.StringVector_clear_keep_capacity(self)
 
     def get_allocator(self):
         return _jamspell.StringVector_get_allocator(self)
@@ -238,13 +196,6 @@ class StringVector(_object):
     def erase(self, *args):
         return _jamspell.StringVector_erase(self, *args)
 
-    def __init__(self, *args):
-        this = _jamspell.new_StringVector(*args)
-        try:
-            self.this.append(this)
-        except __builtin__.Exception:
-            self.this = this
-
     def push_back(self, x):
         return _jamspell.StringVector_push_back(self, x)
 
@@ -268,23 +219,111 @@ class StringVector(_object):
 
     def capacity(self):
         return _jamspell.StringVector_capacity(self)
+
+    def clear(self):
+        return _jamspell.StringVector_clear(self)
+
+    def __init__(self, *args):
+        _jamspell.StringVector_swiginit(self, _jamspell.new_StringVector(*args))
+
+    __slots__ = ('this',)
+
     __swig_destroy__ = _jamspell.delete_StringVector
-    __del__ = lambda self: None
-StringVector_swigregister = _jamspell.StringVector_swigregister
-StringVector_swigregister(StringVector)
-
-class TSpellCorrector(_object):
-    __swig_setmethods__ = {}
-    __setattr__ = lambda self, name, value: _swig_setattr(self, TSpellCorrector, name, value)
-    __swig_getmethods__ = {}
-    __getattr__ = lambda self, name: _swig_getattr(self, TSpellCorrector, name)
+
+# Register StringVector in _jamspell:
+_jamspell.StringVector_swigregister(StringVector)
+
+# threading and namedtuple would pull in collections on import, keep to the builtin _thread
+import _thread
+
+FRAGMENT_CACHE_SIZE = 4096
+
+class CacheInfo(tuple):
+    """(hits, misses, maxsize, currsize), same fields as functools.lru_cache's cache_info()."""
+
+    __slots__ = ()
+
+    def __new__(cls, hits, misses, maxsize, currsize):
+        return tuple.__new__(cls, (hits, misses, maxsize, currsize))
+
+    hits = property(lambda self: self[0])
+    misses = property(lambda self: self[1])
+    maxsize = property(lambda self: self[2])
+    currsize = property(lambda self: self[3])
+
+    def __repr__(self):
+        return 'CacheInfo(hits=%r, misses=%r, maxsize=%r, currsize=%r)' % self
+
+class _FragmentCache(object):
+    """Thread-safe LRU of corrected fragments, same semantics as functools.lru_cache."""
+
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.data = {}
+        self.generation = 0
+        self.lock = _thread.allocate_lock()
+
+    def get(self, key, compute):
+        if self.maxsize == 0:
+            return compute()
+        with self.lock:
+            if key in self.data:
+                self.hits += 1
+                result = self.data.pop(key)
+                self.data[key] = result
+                return result
+            self.misses += 1
+            generation = self.generation
+        result = compute()
+        with self.lock:
+# a reload cleared the cache while this result was computed with the old model
+            if generation != self.generation:
+                return result
+            self.data[key] = result
+            if self.maxsize is not None and len(self.data) > self.maxsize:
+                del self.data[next(iter(self.data))]
+        return result
+
+    def info(self):
+        with self.lock:
+            return CacheInfo(self.hits, self.misses, self.maxsize, len(self.data))
+
+    def clear(self):
+        with self.lock:
+            self.data.clear()
+            self.generation += 1
+            self.hits = 0
+            self.misses = 0
+
+class TSpellCorrector(object):
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
     __repr__ = _swig_repr
 
     def LoadLangModel(self, modelFile):
-        return _jamspell.TSpellCorrector_LoadLangModel(self, modelFile)
+        val = _jamspell.TSpellCorrector_LoadLangModel(self, modelFile)
+        self.cache_clear()
+
+        return val
+
 
     def TrainLangModel(self, textFile, alphabetFile, modelFile):
-        return _jamspell.TSpellCorrector_TrainLangModel(self, textFile, alphabetFile, modelFile)
+        val = _jamspell.TSpellCorrector_TrainLangModel(self, textFile, alphabetFile, modelFile)
+        self.cache_clear()
+
+        return val
+
+
+    def LoadLangModelMmap(self, imageFile):
+        val = _jamspell.TSpellCorrector_LoadLangModelMmap(self, imageFile)
+        self.cache_clear()
+
+        return val
+
+
+    def SaveLangModelMmap(self, imageFile):
+        return _jamspell.TSpellCorrector_SaveLangModelMmap(self, imageFile)
 
     def GetCandidatesScoredRaw(self, sentence, position):
         return _jamspell.TSpellCorrector_GetCandidatesScoredRaw(self, sentence, position)
@@ -292,41 +331,85 @@ class TSpellCorrector(_object):
     def GetCandidatesRaw(self, sentence, position):
         return _jamspell.TSpellCorrector_GetCandidatesRaw(self, sentence, position)
 
-    def GetALLCandidatesScoredJSON(self, text):
-        return _jamspell.TSpellCorrector_GetALLCandidatesScoredJSON(self, text)
+    def GetALLCandidatesScoredJSONBytes(self, text):
+        return _jamspell.TSpellCorrector_GetALLCandidatesScoredJSONBytes(self, text)
+
+    def GetCandidatesScored(self, sentence, position, _f=_jamspell.TSpellCorrector_GetCandidatesScored):
+        return _f(self, sentence, position)
+
+
+
+    def GetCandidates(self, sentence, position, _f=_jamspell.TSpellCorrector_GetCandidates):
+        return _f(self, sentence, position)
+
+
+
+    def GetCandidatesTrie(self, word, maxDist, _f=_jamspell.TSpellCorrector_GetCandidatesTrie):
+        return _f(self, word, maxDist)
+
+
+
+    def FixFragment(self, text, _f=_jamspell.TSpellCorrector_FixFragment):
+        return self._fragmentCache.get(('FixFragment', text), lambda: _f(self, text))
+
+
+
+    def FixFragmentNormalized(self, text, _f=_jamspell.TSpellCorrector_FixFragmentNormalized):
+        return self._fragmentCache.get(('FixFragmentNormalized', text), lambda: _f(self, text))
+
 
-    def GetCandidatesScored(self, sentence, position):
-        return _jamspell.TSpellCorrector_GetCandidatesScored(self, sentence, position)
 
-    def GetCandidates(self, sentence, position):
-        return _jamspell.TSpellCorrector_GetCandidates(self, sentence, position)
+    def FixFragments(self, texts, _f=_jamspell.TSpellCorrector_FixFragments):
+        return _f(self, texts)
+
+
+
+    def FixFragmentBytes(self, text, _f=_jamspell.TSpellCorrector_FixFragmentBytes):
+        return _f(self, text)
+
+
+
+    def FixFragmentNormalizedBytes(self, text, _f=_jamspell.TSpellCorrector_FixFragmentNormalizedBytes):
+        return _f(self, text)
 
-    def FixFragment(self, text):
-        return _jamspell.TSpellCorrector_FixFragment(self, text)
 
-    def FixFragmentNormalized(self, text):
-        return _jamspell.TSpellCorrector_FixFragmentNormalized(self, text)
 
     def SetPenalty(self, knownWordsPenaly, unknownWordsPenalty):
-        return _jamspell.TSpellCorrector_SetPenalty(self, knownWordsPenaly, unknownWordsPenalty)
+        val = _jamspell.TSpellCorrector_SetPenalty(self, knownWordsPenaly, unknownWordsPenalty)
+        self.cache_clear()
+
+        return val
+
 
     def SetMaxCandidatesToCheck(self, maxCandidatesToCheck):
-        return _jamspell.TSpellCorrector_SetMaxCandidatesToCheck(self, maxCandidatesToCheck)
+        val = _jamspell.TSpellCorrector_SetMaxCandidatesToCheck(self, maxCandidatesToCheck)
+        self.cache_clear()
+
+        return val
+
 
     def GetLangModel(self):
         return _jamspell.TSpellCorrector_GetLangModel(self)
 
+    __slots__ = ('this', '_fragmentCache')
+
+    def GetALLCandidatesScoredJSON(self, text):
+        return self.GetALLCandidatesScoredJSONBytes(text).decode('utf-8')
+
+    def cache_info(self):
+        return self._fragmentCache.info()
+
+    def cache_clear(self):
+        self._fragmentCache.clear()
+
+
     def __init__(self):
-        this = _jamspell.new_TSpellCorrector()
-        try:
-            self.this.append(this)
-        except __builtin__.Exception:
-            self.this = this
-    __swig_destroy__ = _jamspell.delete_TSpellCorrector
-    __del__ = lambda self: None
-TSpellCorrector_swigregister = _jamspell.TSpellCorrector_swigregister
-TSpellCorrector_swigregister(TSpellCorrector)
+        _jamspell.TSpellCorrector_swiginit(self, _jamspell.new_TSpellCorrector())
+        self._fragmentCache = _FragmentCache(FRAGMENT_CACHE_SIZE)
 
-# This file is compatible with both classic and new-style classes.
 
+    __swig_destroy__ = _jamspell.delete_TSpellCorrector
+
+# Register TSpellCorrector in _jamspell:
+_jamspell.TSpellCorrector_swigregister(TSpellCorrector)
 
@@ -21,7 +21,42 @@ struct TBloomFilter::Impl: public bloom_filter {
         NHandyPack::Load(in, salt_, bit_table_, salt_count_, table_size_,
                         projected_element_count_, inserted_element_count_,
                         random_seed_, desired_false_positive_probability_);
+        MappedTable = nullptr;
     }
+    void SaveImage(TModelImageWriter& image, EModelImageSection paramsSection, EModelImageSection tableSection) const {
+        image.AddPacked(paramsSection, salt_, salt_count_, table_size_,
+                        projected_element_count_, inserted_element_count_,
+                        random_seed_, desired_false_positive_probability_);
+        image.Add(tableSection, Table(), table_size_ / bits_per_char);
+    }
+    void LoadImage(const TModelImage& image, EModelImageSection paramsSection, EModelImageSection tableSection) {
+        image.LoadPacked(paramsSection, salt_, salt_count_, table_size_,
+                        projected_element_count_, inserted_element_count_,
+                        random_seed_, desired_false_positive_probability_);
+        bit_table_.clear();
+        MappedTable = image.Get<unsigned char>(tableSection).Data;
+    }
+
+    // same as bloom_filter::contains, but reads whichever table is in use
+    using bloom_filter::contains;
+    bool contains(const unsigned char* key_begin, const std::size_t length) const override {
+        const unsigned char* table = Table();
+        std::size_t bit_index = 0;
+        std::size_t bit = 0;
+        for (std::size_t i = 0; i < salt_.size(); ++i) {
+            compute_indices(hash_ap(key_begin, length, salt_[i]), bit_index, bit);
+            if ((table[bit_index / bits_per_char] & bit_mask[bit]) != bit_mask[bit]) {
+                return false;
+            }
+        }
+        return true;
+    }
+
+    const unsigned char* Table() const {
+        return MappedTable ? MappedTable : bit_table_.data();
+    }
+
+    const unsigned char* MappedTable = nullptr; // bit table inside a model image
 };
 
 TBloomFilter::TBloomFilter() {
@@ -57,4 +92,12 @@ void TBloomFilter::Load(std::istream& in) {
     BloomFilter->Load(in);
 }
 
+void TBloomFilter::SaveImage(TModelImageWriter& image, EModelImageSection paramsSection, EModelImageSection tableSection) const {
+    BloomFilter->SaveImage(image, paramsSection, tableSection);
+}
+
+void TBloomFilter::LoadImage(const TModelImage& image, EModelImageSection paramsSection, EModelImageSection tableSection) {
+    BloomFilter->LoadImage(image, paramsSection, tableSection);
+}
+
 } // NJamSpell
@@ -2,6 +2,8 @@
 #include <memory>
 #include <string>
 
+#include "model_image.hpp"
+
 namespace NJamSpell {
 
 class TBloomFilter {
@@ -13,6 +15,8 @@ public:
     bool Contains(const std::string& element) const;
     void Dump(std::ostream& out) const;
     void Load(std::istream& in);
+    void SaveImage(TModelImageWriter& image, EModelImageSection paramsSection, EModelImageSection tableSection) const;
+    void LoadImage(const TModelImage& image, EModelImageSection paramsSection, EModelImageSection tableSection);
 private:
     struct Impl;
     std::unique_ptr<Impl> BloomFilter;
@@ -98,6 +98,12 @@ void InitializeBuckets(const T& grams, TPerfectHash& ph, std::vector<std::pair<u
 bool TLangModel::Train(const std::string& fileName, const std::string& alphabetFile) {
 
     std::cerr << "[info] loading text" << std::endl;
+    // a mapped image restores LastWordID but leaves WordToId empty, new ids
+    // would start past the end of IdToWord; train from scratch instead
+    if (!MappedWordIndex.Empty()) {
+        Clear();
+    }
+    ResetViews();
     uint64_t trainStarTime = GetCurrentTimeMs();
     if (!Tokenizer.LoadAlphabet(alphabetFile)) {
         std::cerr << "[error] failed to load alphabet" << std::endl;
@@ -118,6 +124,7 @@ bool TLangModel::Train(const std::string& fileName, const std::string& alphabetF
     std::cerr << "[info] converting to ids" << std::endl;
 
     TIdSentences sentenceIds = ConvertToIds(sentences);
+    UpdateIdToWord();
 
     assert(sentences.size() == sentenceIds.size());
     {
@@ -189,6 +196,7 @@ bool TLangModel::Train(const std::string& fileName, const std::string& alphabetF
     InitializeBuckets(grams3, PerfectHash, Buckets);
 
     std::cerr << "[info] buckets filled" << std::endl;
+    ResetViews();
 
     std::stringbuf checkSumBuf;
     std::ostream checkSumOut(&checkSumBuf);
@@ -274,20 +282,121 @@ bool TLangModel::Load(const std::string& modelFileName) {
         Clear();
         return false;
     }
+    UpdateIdToWord();
+    ResetViews();
+    return true;
+}
+
+// robin_map moves its entries on rehash, so pointers to the keys are
+// only taken once the dictionary is complete
+void TLangModel::UpdateIdToWord() {
     IdToWord.clear();
     IdToWord.resize(WordToId.size() + 1, nullptr);
     for (auto&& it: WordToId) {
         IdToWord[it.second] = &it.first;
     }
+}
+
+static uint64_t WordHash(const wchar_t* ptr, size_t len) {
+    return CityHash64((const char*)ptr, len * sizeof(wchar_t));
+}
+
+void TLangModel::SaveImage(TModelImageWriter& image) const {
+    image.AddPacked(MIS_LANG_MODEL, LastWordID, TotalWords, VocabSize, Tokenizer, CheckSum);
+    PerfectHash.SaveImage(image);
+    image.Add(MIS_BUCKETS, BucketsView);
+    if (!MappedWordIndex.Empty()) {
+        image.Add(MIS_WORDS, MappedWords);
+        image.Add(MIS_WORD_OFFSETS, MappedWordOffsets);
+        image.Add(MIS_WORD_INDEX, MappedWordIndex);
+        return;
+    }
+
+    std::string words;
+    std::vector<uint32_t> offsets;
+    offsets.reserve(IdToWord.size() + 1);
+    for (const std::wstring* w: IdToWord) {
+        offsets.push_back(words.size() / sizeof(wchar_t));
+        if (w) {
+            words.append((const char*)w->data(), w->size() * sizeof(wchar_t));
+        }
+    }
+    offsets.push_back(words.size() / sizeof(wchar_t));
+
+    // linear probing, kept at most half full
+    size_t slots = 2;
+    while (slots < 2 * IdToWord.size()) {
+        slots *= 2;
+    }
+    std::vector<TWordId> index(slots, UnknownWordId);
+    for (TWordId wid = 0; wid < IdToWord.size(); ++wid) {
+        const std::wstring* w = IdToWord[wid];
+        if (!w) {
+            continue;
+        }
+        size_t slot = WordHash(w->data(), w->size()) & (slots - 1);
+        while (index[slot] != UnknownWordId) {
+            slot = (slot + 1) & (slots - 1);
+        }
+        index[slot] = wid;
+    }
+
+    image.Add(MIS_WORDS, std::move(words));
+    image.Add(MIS_WORD_OFFSETS, std::string((const char*)offsets.data(), offsets.size() * sizeof(uint32_t)));
+    image.Add(MIS_WORD_INDEX, std::string((const char*)index.data(), index.size() * sizeof(TWordId)));
+}
+
+bool TLangModel::LoadImage(const TModelImage& image) {
+    Clear();
+    image.LoadPacked(MIS_LANG_MODEL, LastWordID, TotalWords, VocabSize, Tokenizer, CheckSum);
+    PerfectHash.LoadImage(image);
+    BucketsView = image.Get<std::pair<uint16_t, uint16_t>>(MIS_BUCKETS);
+    MappedWords = image.Get<wchar_t>(MIS_WORDS);
+    MappedWordOffsets = image.Get<uint32_t>(MIS_WORD_OFFSETS);
+    MappedWordIndex = image.Get<TWordId>(MIS_WORD_INDEX);
+
+    size_t slots = MappedWordIndex.Size;
+    if (BucketsView.Size != PerfectHash.BucketsNumber() ||
+        MappedWordOffsets.Empty() || MappedWordOffsets[MappedWordOffsets.Size - 1] > MappedWords.Size ||
+        slots < 2 || (slots & (slots - 1)) != 0)
+    {
+        Clear();
+        return false;
+    }
     return true;
 }
 
 void TLangModel::Clear() {
     K = LANG_MODEL_DEFAULT_K;
     WordToId.clear();
+    IdToWord.clear();
     LastWordID = 0;
     TotalWords = 0;
     Tokenizer.Clear();
+    Buckets.clear();
+    PerfectHash.Clear();
+    ResetViews();
+}
+
+void TLangModel::ResetViews() {
+    BucketsView = Buckets;
+    MappedWords = TArrayRef<wchar_t>();
+    MappedWordOffsets = TArrayRef<uint32_t>();
+    MappedWordIndex = TArrayRef<TWordId>();
+}
+
+TWordId TLangModel::FindMappedWord(const wchar_t* ptr, size_t len) const {
+    size_t mask = MappedWordIndex.Size - 1;
+    for (size_t slot = WordHash(ptr, len) & mask;; slot = (slot + 1) & mask) {
+        TWordId wid = MappedWordIndex[slot];
+        if (wid == UnknownWordId) {
+            return UnknownWordId;
+        }
+        TWord w = GetWordById(wid);
+        if (w.Len == len && std::equal(ptr, ptr + len, w.Ptr)) {
+            return wid;
+        }
+    }
 }
 
 const TRobinHash& TLangModel::GetWordToId() {
@@ -318,12 +427,14 @@ TWordId TLangModel::GetWordId(const TWord& word) {
     }
     TWordId wordId = LastWordID;
     ++LastWordID;
-    it = WordToId.insert(std::make_pair(w, wordId)).first;
-    IdToWord.push_back(&(it->first));
+    WordToId.insert(std::make_pair(w, wordId));
     return wordId;
 }
 
 TWordId TLangModel::GetWordIdNoCreate(const TWord& word) const {
+    if (!MappedWordIndex.Empty()) {
+        return FindMappedWord(word.Ptr, word.Len);
+    }
     std::wstring w(word.Ptr, word.Len);
     auto it = WordToId.find(w);
     if (it != WordToId.end()) {
@@ -333,6 +444,14 @@ TWordId TLangModel::GetWordIdNoCreate(const TWord& word) const {
 }
 
 TWord TLangModel::GetWordById(TWordId wid) const {
+    if (!MappedWordIndex.Empty()) {
+        if (size_t(wid) + 1 >= MappedWordOffsets.Size) {
+            return TWord();
+        }
+        uint32_t begin = MappedWordOffsets[wid];
+        uint32_t end = MappedWordOffsets[wid + 1];
+        return begin < end ? TWord(MappedWords.Data + begin, end - begin) : TWord();
+    }
     if (wid >= IdToWord.size()) {
         return TWord();
     }
@@ -348,6 +467,9 @@ uint64_t TLangModel::GetCheckSum() const {
 }
 
 TWord TLangModel::GetWord(const std::wstring& word) const {
+    if (!MappedWordIndex.Empty()) {
+        return GetWordById(FindMappedWord(word.data(), word.size()));
+    }
     auto it = WordToId.find(word);
     if (it != WordToId.end()) {
         return TWord(&it->first[0], it->first.size());
@@ -394,12 +516,12 @@ double TLangModel::GetGram3Prob(TWordId word1, TWordId word2, TWordId word3) con
 template<typename T>
 TCount GetGramHashCount(T key,
                         const TPerfectHash& ph,
-                        const std::vector<std::pair<uint16_t, uint16_t>>& buckets)
+                        TArrayRef<std::pair<uint16_t, uint16_t>> buckets)
 {
     constexpr int TMP_BUF_SIZE = 128;
-    static char tmpBuff[TMP_BUF_SIZE];
-    static MemStream tmpBuffStream(tmpBuff, TMP_BUF_SIZE - 1);
-    static std::ostream out(&tmpBuffStream);
+    static thread_local char tmpBuff[TMP_BUF_SIZE];
+    static thread_local MemStream tmpBuffStream(tmpBuff, TMP_BUF_SIZE - 1);
+    static thread_local std::ostream out(&tmpBuffStream);
 
     tmpBuffStream.Reset();
 
@@ -422,7 +544,7 @@ TCount TLangModel::GetGram1HashCount(TWordId word) const {
         return TCount();
     }
     TGram1Key key = word;
-    return GetGramHashCount(key, PerfectHash, Buckets);
+    return GetGramHashCount(key, PerfectHash, BucketsView);
 }
 
 TCount TLangModel::GetGram2HashCount(TWordId word1, TWordId word2) const {
@@ -430,7 +552,7 @@ TCount TLangModel::GetGram2HashCount(TWordId word1, TWordId word2) const {
         return TCount();
     }
     TGram2Key key({word1, word2});
-    return GetGramHashCount(key, PerfectHash, Buckets);
+    return GetGramHashCount(key, PerfectHash, BucketsView);
 }
 
 TCount TLangModel::GetGram3HashCount(TWordId word1, TWordId word2, TWordId word3) const {
@@ -438,7 +560,7 @@ TCount TLangModel::GetGram3HashCount(TWordId word1, TWordId word2, TWordId word3
         return TCount();
     }
     TGram3Key key(word1, word2, word3);
-    return GetGramHashCount(key, PerfectHash, Buckets);
+    return GetGramHashCount(key, PerfectHash, BucketsView);
 }
 
 } // NJamSpell
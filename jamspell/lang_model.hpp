@@ -10,6 +10,7 @@
 #include <contrib/tsl/robin_map.h>
 #include "utils.hpp"
 #include "perfect_hash.hpp"
+#include "model_image.hpp"
 
 
 namespace NJamSpell {
@@ -66,6 +67,8 @@ public:
 
     bool Dump(const std::string& modelFileName) const;
     bool Load(const std::string& modelFileName);
+    void SaveImage(TModelImageWriter& image) const;
+    bool LoadImage(const TModelImage& image);
     void Clear();
 
     const TRobinHash& GetWordToId();
@@ -90,6 +93,10 @@ private:
     TCount GetGram2HashCount(TWordId word1, TWordId word2) const;
     TCount GetGram3HashCount(TWordId word1, TWordId word2, TWordId word3) const;
 
+    TWordId FindMappedWord(const wchar_t* ptr, size_t len) const;
+    void UpdateIdToWord();
+    void ResetViews();
+
 private:
     const TWordId UnknownWordId = std::numeric_limits<TWordId>::max();
     double K = LANG_MODEL_DEFAULT_K;
@@ -102,6 +109,13 @@ private:
     std::vector<std::pair<uint16_t, uint16_t>> Buckets;
     TPerfectHash PerfectHash;
     uint64_t CheckSum;
+
+    // n-gram table as seen by lookups: Buckets or a model image section
+    TArrayRef<std::pair<uint16_t, uint16_t>> BucketsView;
+    // dictionary of a mapped model, WordToId and IdToWord stay empty then
+    TArrayRef<wchar_t> MappedWords;
+    TArrayRef<uint32_t> MappedWordOffsets;
+    TArrayRef<TWordId> MappedWordIndex;
 };
 
 
@@ -0,0 +1,117 @@
+#include <fstream>
+#include <iostream>
+
+#ifndef _WIN32
+    #include <fcntl.h>
+    #include <sys/mman.h>
+    #include <sys/stat.h>
+    #include <unistd.h>
+#endif
+
+#include "model_image.hpp"
+
+namespace NJamSpell {
+
+static uint64_t AlignUp(uint64_t offset) {
+    return (offset + MODEL_IMAGE_ALIGNMENT - 1) / MODEL_IMAGE_ALIGNMENT * MODEL_IMAGE_ALIGNMENT;
+}
+
+void TModelImageWriter::Add(EModelImageSection section, const void* data, size_t size) {
+    Data[section] = (const char*)data;
+    Sections[section].Size = size;
+}
+
+void TModelImageWriter::Add(EModelImageSection section, std::string&& data) {
+    Owned.push_back(std::move(data));
+    Add(section, Owned.back().data(), Owned.back().size());
+}
+
+bool TModelImageWriter::Save(const std::string& fileName, uint64_t checkSum) const {
+    std::ofstream out(fileName, std::ios::binary);
+    if (!out.is_open()) {
+        return false;
+    }
+    TModelImageHeader header = {};
+    header.MagicByte = MODEL_IMAGE_MAGIC_BYTE;
+    header.Version = MODEL_IMAGE_VERSION;
+    header.WCharSize = sizeof(wchar_t);
+    header.SectionsNumber = MIS_SECTIONS_NUMBER;
+    header.CheckSum = checkSum;
+    uint64_t offset = AlignUp(sizeof(header));
+    for (size_t i = 0; i < MIS_SECTIONS_NUMBER; ++i) {
+        header.Sections[i].Offset = offset;
+        header.Sections[i].Size = Sections[i].Size;
+        offset = AlignUp(offset + Sections[i].Size);
+    }
+
+    const char padding[MODEL_IMAGE_ALIGNMENT] = {};
+    out.write((const char*)&header, sizeof(header));
+    uint64_t written = sizeof(header);
+    for (size_t i = 0; i < MIS_SECTIONS_NUMBER; ++i) {
+        out.write(padding, header.Sections[i].Offset - written);
+        out.write(Data[i], header.Sections[i].Size);
+        written = header.Sections[i].Offset + header.Sections[i].Size;
+    }
+    return out.good();
+}
+
+TModelImage::~TModelImage() {
+    Close();
+}
+
+bool TModelImage::Open(const std::string& fileName) {
+    Close();
+#ifdef _WIN32
+    std::cerr << "[error] model images are not supported on this platform\n";
+    return false;
+#else
+    int fd = open(fileName.c_str(), O_RDONLY);
+    if (fd == -1) {
+        return false;
+    }
+    struct stat st;
+    if (fstat(fd, &st) != 0 || size_t(st.st_size) < sizeof(TModelImageHeader)) {
+        close(fd);
+        return false;
+    }
+    void* data = mmap(nullptr, st.st_size, PROT_READ, MAP_SHARED, fd, 0);
+    close(fd);
+    if (data == MAP_FAILED) {
+        return false;
+    }
+    Data = (const char*)data;
+    Size = st.st_size;
+    Header = (const TModelImageHeader*)Data;
+
+    bool valid = Header->MagicByte == MODEL_IMAGE_MAGIC_BYTE &&
+                 Header->Version == MODEL_IMAGE_VERSION &&
+                 Header->WCharSize == sizeof(wchar_t) &&
+                 Header->SectionsNumber == MIS_SECTIONS_NUMBER;
+    for (size_t i = 0; valid && i < MIS_SECTIONS_NUMBER; ++i) {
+        const TModelImageSection& s = Header->Sections[i];
+        valid = s.Offset % MODEL_IMAGE_ALIGNMENT == 0 && s.Offset <= Size && s.Size <= Size - s.Offset;
+    }
+    if (!valid) {
+        Close();
+        return false;
+    }
+    return true;
+#endif
+}
+
+void TModelImage::Close() {
+#ifndef _WIN32
+    if (Data) {
+        munmap((void*)Data, Size);
+    }
+#endif
+    Data = nullptr;
+    Size = 0;
+    Header = nullptr;
+}
+
+uint64_t TModelImage::GetCheckSum() const {
+    return Header->CheckSum;
+}
+
+} // NJamSpell
@@ -0,0 +1,104 @@
+#pragma once
+
+#include <list>
+#include <sstream>
+#include <string>
+#include <vector>
+
+#include <contrib/handypack/handypack.hpp>
+#include "utils.hpp"
+
+namespace NJamSpell {
+
+constexpr uint64_t MODEL_IMAGE_MAGIC_BYTE = 7306916375442098509L;
+constexpr uint16_t MODEL_IMAGE_VERSION = 2;
+constexpr size_t MODEL_IMAGE_ALIGNMENT = 64;
+
+enum EModelImageSection: uint32_t {
+    MIS_LANG_MODEL = 0,         // packed scalars and tokenizer alphabet
+    MIS_WORDS,                  // dictionary words back to back, wchar_t
+    MIS_WORD_OFFSETS,           // uint32 start of every word id in MIS_WORDS, plus the end
+    MIS_WORD_INDEX,             // open addressing word -> id table, uint32 per slot
+    MIS_PERFECT_HASH_PARAMS,    // packed phf parameters
+    MIS_PERFECT_HASH,           // phf displacement map, uint32
+    MIS_BUCKETS,                // n-gram (hash16, packed count) pairs
+    MIS_DELETES1_PARAMS,        // packed bloom filter parameters
+    MIS_DELETES1,               // bloom filter bit table
+    MIS_DELETES2_PARAMS,
+    MIS_DELETES2,
+    MIS_TRIE_PARAMS,            // packed longest word length
+    MIS_TRIE_LETTERS,           // wchar_t per trie column
+    MIS_TRIE_CHILDREN,          // 3-byte child index per (node, letter)
+    MIS_TRIE_TERMINALS,         // bit per node
+    MIS_TRIE_WORD_IDS,          // uint32 per node
+    MIS_TRIE_WORD_COUNTS,       // uint32 per node
+    MIS_SECTIONS_NUMBER
+};
+
+struct TModelImageSection {
+    uint64_t Offset;
+    uint64_t Size;
+};
+
+// Image files are raw native-endian memory, they are only meant
+// to be read on the platform that wrote them.
+struct TModelImageHeader {
+    uint64_t MagicByte;
+    uint16_t Version;
+    uint16_t WCharSize;
+    uint32_t SectionsNumber;
+    uint64_t CheckSum;
+    TModelImageSection Sections[MIS_SECTIONS_NUMBER];
+};
+
+// Collects sections and writes them out, each one aligned to MODEL_IMAGE_ALIGNMENT.
+class TModelImageWriter {
+public:
+    // data is referenced, it has to stay alive until Save
+    void Add(EModelImageSection section, const void* data, size_t size);
+    void Add(EModelImageSection section, std::string&& data);
+    template<typename T>
+    void Add(EModelImageSection section, TArrayRef<T> data) {
+        Add(section, data.Data, data.Size * sizeof(T));
+    }
+    template<typename... Args>
+    void AddPacked(EModelImageSection section, const Args&... args) {
+        std::ostringstream out;
+        NHandyPack::Dump(out, args...);
+        Add(section, out.str());
+    }
+    bool Save(const std::string& fileName, uint64_t checkSum) const;
+private:
+    TModelImageSection Sections[MIS_SECTIONS_NUMBER] = {};
+    const char* Data[MIS_SECTIONS_NUMBER] = {};
+    std::list<std::string> Owned;
+};
+
+// Read-only shared mapping of an image file: bulky arrays are used in place,
+// only the small packed sections get deserialized.
+class TModelImage {
+public:
+    TModelImage() = default;
+    TModelImage(const TModelImage& other) = delete;
+    ~TModelImage();
+    bool Open(const std::string& fileName);
+    void Close();
+    uint64_t GetCheckSum() const;
+    template<typename T>
+    TArrayRef<T> Get(EModelImageSection section) const {
+        const TModelImageSection& s = Header->Sections[section];
+        return TArrayRef<T>(reinterpret_cast<const T*>(Data + s.Offset), s.Size / sizeof(T));
+    }
+    template<typename... Args>
+    void LoadPacked(EModelImageSection section, Args&... args) const {
+        const TModelImageSection& s = Header->Sections[section];
+        std::istringstream in(std::string(Data + s.Offset, s.Size));
+        NHandyPack::Load(in, args...);
+    }
+private:
+    const char* Data = nullptr;
+    size_t Size = 0;
+    const TModelImageHeader* Header = nullptr;
+};
+
+} // NJamSpell
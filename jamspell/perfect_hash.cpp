@@ -32,6 +32,31 @@ void TPerfectHash::Load(std::istream& in) {
     in.read((char*)perfHash.g, perfHash.r * sizeof(uint32_t));
 }
 
+void TPerfectHash::SaveImage(TModelImageWriter& image) const {
+    const phf& perfHash = *(const phf*)Phf;
+    image.AddPacked(MIS_PERFECT_HASH_PARAMS, perfHash.d_max,
+                                             perfHash.g_op,
+                                             perfHash.m,
+                                             perfHash.r,
+                                             perfHash.seed,
+                                             perfHash.nodiv);
+    image.Add(MIS_PERFECT_HASH, perfHash.g, perfHash.r * sizeof(uint32_t));
+}
+
+void TPerfectHash::LoadImage(const TModelImage& image) {
+    Clear();
+    Phf = new phf();
+    phf& perfHash = *(phf*)Phf;
+    image.LoadPacked(MIS_PERFECT_HASH_PARAMS, perfHash.d_max,
+                                              perfHash.g_op,
+                                              perfHash.m,
+                                              perfHash.r,
+                                              perfHash.seed,
+                                              perfHash.nodiv);
+    perfHash.g = (uint32_t*)image.Get<uint32_t>(MIS_PERFECT_HASH).Data;
+    Mapped = true;
+}
+
 bool TPerfectHash::Init(const std::vector<std::string>& keys) {
     std::vector<phf_string_t> keysForPhf;
     keysForPhf.reserve(keys.size());
@@ -55,13 +80,19 @@ void TPerfectHash::Clear() {
     if (!Phf) {
         return;
     }
+    if (Mapped) {
+        ((phf*)Phf)->g = nullptr;
+        Mapped = false;
+    }
     PHF::destroy((phf*)Phf);
     delete (phf*)Phf;
+    Phf = nullptr;
 }
 
 uint32_t TPerfectHash::Hash(const std::string& value) const {
-    assert(Phf && "Not initialized");
-    return PHF::hash<std::string>((phf*)Phf, value);
+    // phf caches the computed goto label of the last PHF::hash instantiation
+    // in phf::g_jmp, mixing key types would jump into a foreign function
+    return Hash(value.data(), value.size());
 }
 
 uint32_t TPerfectHash::Hash(const char* value, size_t size) const {
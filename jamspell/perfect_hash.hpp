@@ -2,6 +2,8 @@
 
 #include <ostream>
 
+#include "model_image.hpp"
+
 namespace NJamSpell {
 
 class TPerfectHash {
@@ -11,6 +13,8 @@ public:
     ~TPerfectHash();
     void Dump(std::ostream& out) const;
     void Load(std::istream& in);
+    void SaveImage(TModelImageWriter& image) const;
+    void LoadImage(const TModelImage& image);
     bool Init(const std::vector<std::string>& keys);
     void Clear();
     uint32_t Hash(const std::string& value) const;
@@ -18,6 +22,7 @@ public:
     uint32_t BucketsNumber() const;
 private:
     void* Phf; // sort of forward declaration
+    bool Mapped = false; // displacement map points into a model image
 };
 
 } // NJamSpell
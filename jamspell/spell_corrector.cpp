@@ -10,6 +10,10 @@ namespace NJamSpell {
 
 const std::string VERSION = "1.1a";
 
+// candidate vectors are created and dropped for every word of every fragment
+static thread_local TVectorPool<TWord> WordsPool;
+static thread_local TVectorPool<TScoredWord> ScoredWordsPool;
+
 static std::vector<std::wstring> GetDeletes1(const std::wstring& w) {
     std::vector<std::wstring> results;
     for (size_t i = 0; i < w.size(); ++i) {
@@ -35,6 +39,7 @@ static std::vector<std::vector<std::wstring>> GetDeletes2(const std::wstring& w)
 }
 
 bool TSpellCorrector::LoadLangModel(const std::string& modelFile) {
+    TWriteGuard guard(Lock);
     std::cerr << "[info] medSpellCheck v" << VERSION << ". Based on jamspell.\n";
     if (!LangModel.Load(modelFile)) {
         return false;
@@ -42,16 +47,20 @@ bool TSpellCorrector::LoadLangModel(const std::string& modelFile) {
     std::string cacheFile = modelFile + ".spell";
     if (!LoadCache(cacheFile)) {
         PrepareCache();
+        PrepareTrie();
         SaveCache(cacheFile);
     }
+    Image.reset();
     return true;
 }
 
 bool TSpellCorrector::TrainLangModel(const std::string& textFile, const std::string& alphabetFile, const std::string& modelFile) {
+    TWriteGuard guard(Lock);
     if (!LangModel.Train(textFile, alphabetFile)) {
         return false;
     }
     PrepareCache();
+    PrepareTrie();
     if (!LangModel.Dump(modelFile)) {
         return false;
     }
@@ -59,10 +68,69 @@ bool TSpellCorrector::TrainLangModel(const std::string& textFile, const std::str
     if (!SaveCache(cacheFile)) {
         return false;
     }
+    Image.reset();
     return true;
 }
 
+// Model and cache in one image (see SaveLangModelMmap), mapped read-only and shared:
+// nothing is parsed except the dictionary alphabet and a few scalars, so loading
+// takes milliseconds and processes using the same image share its pages.
+bool TSpellCorrector::LoadLangModelMmap(const std::string& imageFile) {
+    TWriteGuard guard(Lock);
+    std::cerr << "[info] medSpellCheck v" << VERSION << ". Based on jamspell.\n";
+    std::cerr << "[info] mapping model image (" << imageFile << ")\n";
+    std::unique_ptr<TModelImage> image(new TModelImage());
+    if (!image->Open(imageFile)) {
+        return false;
+    }
+    std::unique_ptr<TBloomFilter> deletes1(new TBloomFilter());
+    std::unique_ptr<TBloomFilter> deletes2(new TBloomFilter());
+    deletes1->LoadImage(*image, MIS_DELETES1_PARAMS, MIS_DELETES1);
+    deletes2->LoadImage(*image, MIS_DELETES2_PARAMS, MIS_DELETES2);
+    // past this point the old model is gone either way
+    if (!LangModel.LoadImage(*image) || LangModel.GetCheckSum() != image->GetCheckSum() ||
+        !Trie.LoadImage(*image))
+    {
+        LangModel.Clear();
+        Trie.Clear();
+        Deletes1.reset();
+        Deletes2.reset();
+        Image.reset();
+        return false;
+    }
+    Deletes1 = std::move(deletes1);
+    Deletes2 = std::move(deletes2);
+    SortedWordIds.clear();
+    SortedWordsLcp.clear();
+    Image = std::move(image);
+    return true;
+}
+
+bool TSpellCorrector::SaveLangModelMmap(const std::string& imageFile) const {
+    TReadGuard guard(Lock);
+    std::cerr << "[info] saving model image (" << imageFile << ")\n";
+    if (!Deletes1 || !Deletes2) {
+        return false;
+    }
+    TModelImageWriter image;
+    LangModel.SaveImage(image);
+    Deletes1->SaveImage(image, MIS_DELETES1_PARAMS, MIS_DELETES1);
+    Deletes2->SaveImage(image, MIS_DELETES2_PARAMS, MIS_DELETES2);
+    Trie.SaveImage(image);
+    return image.Save(imageFile, LangModel.GetCheckSum());
+}
+
 TScoredWords TSpellCorrector::GetCandidatesScoredRaw(const TWords& sentence, size_t position) const {
+    TReadGuard guard(Lock);
+    return GetCandidatesScoredRawImpl(sentence, position);
+}
+
+TWords TSpellCorrector::GetCandidatesRaw(const TWords& sentence, size_t position) const {
+    TReadGuard guard(Lock);
+    return GetCandidatesRawImpl(sentence, position);
+}
+
+TScoredWords TSpellCorrector::GetCandidatesScoredRawImpl(const TWords& sentence, size_t position) const {
    if (position >= sentence.size()) {
         return TScoredWords();
     }
@@ -97,11 +165,12 @@ TScoredWords TSpellCorrector::GetCandidatesScoredRaw(const TWords& sentence, siz
 
     FilterCandidatesByFrequency(uniqueCandidates, w);
 
-    TScoredWords scoredCandidates;
+    TScoredWords scoredCandidates = ScoredWordsPool.Get();
     //scoredCandidates.reserve(uniqueCandidates.size());
 
+    TWords candSentence = WordsPool.Get();
     for (TWord cand: uniqueCandidates) {
-        TWords candSentence;
+        candSentence.clear();
         for (size_t i = 0; i < sentence.size(); ++i) {
             if (i == position) {
                 candSentence.push_back(cand);
@@ -128,6 +197,7 @@ TScoredWords TSpellCorrector::GetCandidatesScoredRaw(const TWords& sentence, siz
         }
         scoredCandidates.push_back(scored); // {scored.Word, scored.Score} );
     }
+    WordsPool.Release(std::move(candSentence));
 
     std::sort(scoredCandidates.begin(), scoredCandidates.end(), [](TScoredWord w1, TScoredWord w2) {
         return w1.Score > w2.Score;
@@ -137,17 +207,18 @@ TScoredWords TSpellCorrector::GetCandidatesScoredRaw(const TWords& sentence, siz
 
 }
 
-TWords TSpellCorrector::GetCandidatesRaw(const TWords& sentence, size_t position) const {
+TWords TSpellCorrector::GetCandidatesRawImpl(const TWords& sentence, size_t position) const {
     
-    TScoredWords scoredCandidates = GetCandidatesScoredRaw(sentence, position);
+    TScoredWords scoredCandidates = GetCandidatesScoredRawImpl(sentence, position);
     
-    TWords candidates;
+    TWords candidates = WordsPool.Get();
     candidates.reserve(scoredCandidates.size());
 
     for (auto s: scoredCandidates) { 
         std::cerr << ">> cand " << WideToUTF8(std::wstring(s.Word.Ptr, s.Word.Len)) << " (score=" << s.Score << ")\n";
         candidates.push_back(s.Word);
     }
+    ScoredWordsPool.Release(std::move(scoredCandidates));
     return candidates;
 }
 
@@ -175,11 +246,12 @@ void TSpellCorrector::FilterCandidatesByFrequency(std::unordered_set<TWord, TWor
 
 //takes a string sentence as input, returns a json string of scored candidates as output
 TScoredWords TSpellCorrector::GetCandidatesScored(const std::vector<std::wstring>& sentence, size_t position) const {
+    TReadGuard guard(Lock);
     TWords words;
     for (auto&& w: sentence) {
         words.push_back(TWord(w));
     }
-    TScoredWords candidates = GetCandidatesScoredRaw(words, position);
+    TScoredWords candidates = GetCandidatesScoredRawImpl(words, position);
     return candidates;
     /* std::vector<std::wstring> results;
     for (auto&& c: candidates) {
@@ -192,6 +264,7 @@ TScoredWords TSpellCorrector::GetCandidatesScored(const std::vector<std::wstring
 // this takes a string as an input and returns json as string
 // returns ALL detected misspellings along with scores, locations, and candidates
 std::string TSpellCorrector::GetALLCandidatesScoredJSON(const std::string& text) const {
+    TReadGuard guard(Lock);
     std::wstring input = NJamSpell::UTF8ToWide(text);
     std::transform(input.begin(), input.end(), input.begin(), std::towlower);
     NJamSpell::TSentences sentences = LangModel.Tokenize(input);
@@ -205,7 +278,7 @@ std::string TSpellCorrector::GetALLCandidatesScoredJSON(const std::string& text)
             NJamSpell::TWord currWord = sentence[j];
             std::wstring wCurrWord(currWord.Ptr, currWord.Len);
             //std::cerr << "  word " << NJamSpell::WideToUTF8(wCurrWord) << std::endl;
-            NJamSpell::TScoredWords candidates = GetCandidatesScoredRaw(sentence, j);
+            NJamSpell::TScoredWords candidates = GetCandidatesScoredRawImpl(sentence, j);
             if (candidates.empty()) {
                 continue;
             }
@@ -237,19 +310,50 @@ std::string TSpellCorrector::GetALLCandidatesScoredJSON(const std::string& text)
 }
 
 std::vector<std::wstring> TSpellCorrector::GetCandidates(const std::vector<std::wstring>& sentence, size_t position) const {
+    TReadGuard guard(Lock);
     TWords words;
     for (auto&& w: sentence) {
         words.push_back(TWord(w));
     }
-    TWords candidates = GetCandidatesRaw(words, position);
+    TWords candidates = GetCandidatesRawImpl(words, position);
     std::vector<std::wstring> results;
     for (auto&& c: candidates) {
         results.push_back(std::wstring(c.Ptr, c.Len));
     }
+    WordsPool.Release(std::move(candidates));
+    return results;
+}
+
+// dictionary words within maxDist edits of the word, closest first, then most frequent
+std::vector<std::wstring> TSpellCorrector::GetCandidatesTrie(const std::wstring& word, size_t maxDist) const {
+    TReadGuard guard(Lock);
+    TTrieMatches matches = Trie.Search(word, maxDist);
+    std::sort(matches.begin(), matches.end(), [](const TTrieMatch& a, const TTrieMatch& b) {
+        if (a.Distance != b.Distance) {
+            return a.Distance < b.Distance;
+        }
+        return a.Count > b.Count;
+    });
+    std::vector<std::wstring> results;
+    results.reserve(matches.size());
+    for (auto&& m: matches) {
+        TWord w = LangModel.GetWordById(m.WordId);
+        results.push_back(std::wstring(w.Ptr, w.Len));
+    }
     return results;
 }
 
 std::wstring TSpellCorrector::FixFragment(const std::wstring& text) const {
+    TReadGuard guard(Lock);
+    return FixFragmentImpl(text);
+}
+
+std::wstring TSpellCorrector::FixFragmentNormalized(const std::wstring& text) const {
+    TReadGuard guard(Lock);
+    return FixFragmentNormalizedImpl(text);
+}
+
+std::wstring TSpellCorrector::FixFragmentImpl(const std::wstring& text) const {
     TSentences origSentences = LangModel.Tokenize(text);
     std::wstring lowered = text;
     ToLower(lowered);
@@ -262,10 +366,11 @@ std::wstring TSpellCorrector::FixFragment(const std::wstring& text) const {
         for (size_t j = 0; j < words.size(); ++j) {
             TWord orig = origWords[j];
             TWord lowered = words[j];
-            TWords candidates = GetCandidatesRaw(words, j);
+            TWords candidates = GetCandidatesRawImpl(words, j);
             if (candidates.size() > 0) {
                 words[j] = candidates[0];
             }
+            WordsPool.Release(std::move(candidates));
             size_t currOrigPos = orig.Ptr - &text[0];
             while (origPos < currOrigPos) {
                 result.push_back(text[origPos]);
@@ -294,7 +399,7 @@ std::wstring TSpellCorrector::FixFragment(const std::wstring& text) const {
     return result;
 }
 
-std::wstring TSpellCorrector::FixFragmentNormalized(const std::wstring& text) const {
+std::wstring TSpellCorrector::FixFragmentNormalizedImpl(const std::wstring& text) const {
     std::wstring lowered = text;
     ToLower(lowered);
     TSentences sentences = LangModel.Tokenize(lowered);
@@ -302,10 +407,11 @@ std::wstring TSpellCorrector::FixFragmentNormalized(const std::wstring& text) co
     for (size_t i = 0; i < sentences.size(); ++i) {
         TWords words = sentences[i];
         for (size_t i = 0; i < words.size(); ++i) {
-            TWords candidates = GetCandidatesRaw(words, i);
+            TWords candidates = GetCandidatesRawImpl(words, i);
             if (candidates.size() > 0) {
                 words[i] = candidates[0];
             }
+            WordsPool.Release(std::move(candidates));
             result += std::wstring(words[i].Ptr, words[i].Len) + L" ";
         }
         if (words.size() > 0) {
@@ -319,12 +425,36 @@ std::wstring TSpellCorrector::FixFragmentNormalized(const std::wstring& text) co
     return result;
 }
 
+// fixes a batch of fragments in one call, so bindings cross the language boundary once per batch
+std::vector<std::wstring> TSpellCorrector::FixFragments(const std::vector<std::wstring>& texts) const {
+    TReadGuard guard(Lock);
+    std::vector<std::wstring> results;
+    results.reserve(texts.size());
+    for (auto&& text: texts) {
+        results.push_back(FixFragmentImpl(text));
+    }
+    return results;
+}
+
+// utf-8 in, utf-8 out - lets bindings hand over raw bytes without building a wstring on their side
+std::string TSpellCorrector::FixFragment(const char* text, size_t len) const {
+    TReadGuard guard(Lock);
+    return WideToUTF8(FixFragmentImpl(UTF8ToWide(text, text + len)));
+}
+
+std::string TSpellCorrector::FixFragmentNormalized(const char* text, size_t len) const {
+    TReadGuard guard(Lock);
+    return WideToUTF8(FixFragmentNormalizedImpl(UTF8ToWide(text, text + len)));
+}
+
 void TSpellCorrector::SetPenalty(double knownWordsPenaly, double unknownWordsPenalty) {
+    TWriteGuard guard(Lock);
     KnownWordsPenalty = knownWordsPenaly;
     UnknownWordsPenalty = unknownWordsPenalty;
 }
 
 void TSpellCorrector::SetMaxCandidatesToCheck(size_t maxCandidatesToCheck) {
+    TWriteGuard guard(Lock);
     MaxCandidatesToCheck = maxCandidatesToCheck;
 }
 
@@ -515,8 +645,51 @@ void TSpellCorrector::PrepareCache() {
     std::cerr << "[info] cache preparation complete\n";
 }
 
+// sorts the dictionary and records common prefix lengths, so the trie can be
+// (re)built in one sequential pass - here and on every cache load
+void TSpellCorrector::PrepareTrie() {
+    std::cerr << "[info] sorting dictionary" << std::endl;
+    using TWordWithId = std::pair<const std::wstring*, TWordId>;
+    std::vector<TWordWithId> words;
+    for (auto&& it: LangModel.GetWordToId()) {
+        words.push_back(std::make_pair(&it.first, it.second));
+    }
+    std::sort(words.begin(), words.end(), [](const TWordWithId& a, const TWordWithId& b) {
+        return *a.first < *b.first;
+    });
+
+    SortedWordIds.clear();
+    SortedWordsLcp.clear();
+    SortedWordIds.reserve(words.size());
+    SortedWordsLcp.reserve(words.size());
+    const std::wstring* prev = nullptr;
+    for (auto&& w: words) {
+        size_t lcp = 0;
+        if (prev) {
+            size_t maxLcp = std::min(std::min(prev->size(), w.first->size()), size_t(std::numeric_limits<uint16_t>::max()));
+            while (lcp < maxLcp && (*prev)[lcp] == (*w.first)[lcp]) {
+                ++lcp;
+            }
+        }
+        SortedWordIds.push_back(w.second);
+        SortedWordsLcp.push_back(lcp);
+        prev = w.first;
+    }
+    BuildTrie();
+}
+
+void TSpellCorrector::BuildTrie() {
+    std::cerr << "[info] building dictionary trie" << std::endl;
+    Trie.Init(LangModel.GetAlphabet());
+    for (size_t i = 0; i < SortedWordIds.size(); ++i) {
+        TWordId wid = SortedWordIds[i];
+        Trie.Append(LangModel.GetWordById(wid), SortedWordsLcp[i], wid, LangModel.GetWordCount(wid));
+    }
+    std::cerr << "[info] trie built, nodes: " << Trie.NodesNumber() << "\n";
+}
+
 constexpr uint64_t SPELL_CHECKER_CACHE_MAGIC_BYTE = 3811558393781437494L;
-constexpr uint16_t SPELL_CHECKER_CACHE_VERSION = 1;
+constexpr uint16_t SPELL_CHECKER_CACHE_VERSION = 2;
 
 bool TSpellCorrector::LoadCache(const std::string& cacheFile) {
     std::cerr << "[info] loading cache (" << cacheFile << ")\n";
@@ -543,6 +716,9 @@ bool TSpellCorrector::LoadCache(const std::string& cacheFile) {
     std::unique_ptr<TBloomFilter> deletes2(new TBloomFilter());
     deletes1->Load(in);
     deletes2->Load(in);
+    std::vector<TWordId> sortedWordIds;
+    std::vector<uint16_t> sortedWordsLcp;
+    NHandyPack::Load(in, sortedWordIds, sortedWordsLcp);
     magicByte = 0;
     NHandyPack::Load(in, magicByte);
     if (magicByte != SPELL_CHECKER_CACHE_MAGIC_BYTE) {
@@ -550,6 +726,9 @@ bool TSpellCorrector::LoadCache(const std::string& cacheFile) {
     }
     Deletes1 = std::move(deletes1);
     Deletes2 = std::move(deletes2);
+    SortedWordIds.swap(sortedWordIds);
+    SortedWordsLcp.swap(sortedWordsLcp);
+    BuildTrie();
     return true;
 }
 
@@ -567,6 +746,7 @@ bool TSpellCorrector::SaveCache(const std::string& cacheFile) {
     NHandyPack::Dump(out, LangModel.GetCheckSum());
     Deletes1->Dump(out);
     Deletes2->Dump(out);
+    NHandyPack::Dump(out, SortedWordIds, SortedWordsLcp);
     NHandyPack::Dump(out, SPELL_CHECKER_CACHE_MAGIC_BYTE);
     std::cerr << "[info] cache saved\n";
     return true;
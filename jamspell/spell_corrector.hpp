@@ -1,40 +1,68 @@
 #pragma once
 
 #include <memory>
+#include <mutex>
+#include <shared_mutex>
 
 #include "lang_model.hpp"
 #include "bloom_filter.hpp"
+#include "trie.hpp"
 
 namespace NJamSpell {
 
 
+// Queries (FixFragment*, GetCandidates*, GetALLCandidatesScoredJSON, SaveLangModelMmap)
+// may run concurrently from any number of threads; LoadLangModel*, TrainLangModel
+// and the setters wait for running queries and block new ones while they work.
+// Words returned by the *Raw methods and GetLangModel() point into the model
+// and are only valid until it is reloaded.
 class TSpellCorrector {
 public:
     bool LoadLangModel(const std::string& modelFile);
     bool TrainLangModel(const std::string& textFile, const std::string& alphabetFile, const std::string& modelFile);
+    bool LoadLangModelMmap(const std::string& imageFile);
+    bool SaveLangModelMmap(const std::string& imageFile) const;
     NJamSpell::TScoredWords GetCandidatesScoredRaw(const NJamSpell::TWords& sentence, size_t position) const;
     NJamSpell::TWords GetCandidatesRaw(const NJamSpell::TWords& sentence, size_t position) const;
     std::string GetALLCandidatesScoredJSON(const std::string& text) const;
     NJamSpell::TScoredWords GetCandidatesScored(const std::vector<std::wstring>& sentence, size_t position) const;
     std::vector<std::wstring> GetCandidates(const std::vector<std::wstring>& sentence, size_t position) const;
+    std::vector<std::wstring> GetCandidatesTrie(const std::wstring& word, size_t maxDist) const;
     std::wstring FixFragment(const std::wstring& text) const;
     std::wstring FixFragmentNormalized(const std::wstring& text) const;
+    std::vector<std::wstring> FixFragments(const std::vector<std::wstring>& texts) const;
+    std::string FixFragment(const char* text, size_t len) const;
+    std::string FixFragmentNormalized(const char* text, size_t len) const;
     void SetPenalty(double knownWordsPenaly, double unknownWordsPenalty);
     void SetMaxCandidatesToCheck(size_t maxCandidatesToCheck);
     const NJamSpell::TLangModel& GetLangModel() const;
 private:
+    NJamSpell::TScoredWords GetCandidatesScoredRawImpl(const NJamSpell::TWords& sentence, size_t position) const;
+    NJamSpell::TWords GetCandidatesRawImpl(const NJamSpell::TWords& sentence, size_t position) const;
+    std::wstring FixFragmentImpl(const std::wstring& text) const;
+    std::wstring FixFragmentNormalizedImpl(const std::wstring& text) const;
     void FilterCandidatesByFrequency(std::unordered_set<NJamSpell::TWord, NJamSpell::TWordHashPtr>& uniqueCandidates, NJamSpell::TWord origWord) const;
     NJamSpell::TWords Edits(const NJamSpell::TWord& word) const;
     NJamSpell::TWords Edits2(const NJamSpell::TWord& word, bool lastLevel = true) const;
     void Inserts(const std::wstring& w, NJamSpell::TWords& result) const;
     void Inserts2(const std::wstring& w, NJamSpell::TWords& result) const;
     void PrepareCache();
+    void PrepareTrie();
+    void BuildTrie();
     bool LoadCache(const std::string& cacheFile);
     bool SaveCache(const std::string& cacheFile);
 private:
+    using TReadGuard = std::shared_lock<std::shared_timed_mutex>;
+    using TWriteGuard = std::unique_lock<std::shared_timed_mutex>;
+
+    mutable std::shared_timed_mutex Lock; // public methods take it, *Impl and private helpers expect it held
+    std::unique_ptr<TModelImage> Image; // set while the model is used straight from a mapped image
     TLangModel LangModel;
     std::unique_ptr<TBloomFilter> Deletes1;
     std::unique_ptr<TBloomFilter> Deletes2;
+    TTrie Trie;
+    std::vector<TWordId> SortedWordIds;  // dictionary in lexicographic order
+    std::vector<uint16_t> SortedWordsLcp; // common prefix length with the previous word
     double KnownWordsPenalty = 20.0;
     double UnknownWordsPenalty = 5.0;
     size_t MaxCandidatesToCheck = 14;
@@ -0,0 +1,225 @@
+#include <algorithm>
+
+#include "trie.hpp"
+
+namespace NJamSpell {
+
+static const uint32_t ROOT = 0;
+static const size_t CHILD_SIZE = 3;
+
+void TTrie::Init(const std::unordered_set<wchar_t>& alphabet) {
+    Clear();
+    Letters.assign(alphabet.begin(), alphabet.end());
+    std::sort(Letters.begin(), Letters.end());
+    for (size_t i = 0; i < Letters.size(); ++i) {
+        LetterIndex[Letters[i]] = i;
+    }
+    AddNode();
+    Path.push_back(ROOT);
+}
+
+bool TTrie::Insert(const std::wstring& word, uint32_t wordId, uint32_t count) {
+    if (WordIds.empty()) {
+        return false;
+    }
+    uint32_t node = ROOT;
+    for (wchar_t ch: word) {
+        auto it = LetterIndex.find(ch);
+        if (it == LetterIndex.end()) {
+            return false;
+        }
+        node = GetOrAddChild(node, it->second);
+        if (node == ROOT) {
+            return false;
+        }
+    }
+    SetWord(node, wordId, count);
+    MaxDepth = std::max(MaxDepth, uint32_t(word.size()));
+    return true;
+}
+
+// Insert for words arriving in sorted order: lcp is the length of the prefix
+// shared with the previous word, so the walk resumes from the node where
+// that word branched off instead of descending from the root again.
+bool TTrie::Append(const TWord& word, size_t lcp, uint32_t wordId, uint32_t count) {
+    if (WordIds.empty()) {
+        return false;
+    }
+    Path.resize(std::min(std::min(lcp, word.Len) + 1, Path.size()));
+    for (size_t i = Path.size() - 1; i < word.Len; ++i) {
+        auto it = LetterIndex.find(word.Ptr[i]);
+        if (it == LetterIndex.end()) {
+            return false;
+        }
+        uint32_t child = GetOrAddChild(Path.back(), it->second);
+        if (child == ROOT) {
+            return false;
+        }
+        Path.push_back(child);
+    }
+    SetWord(Path[word.Len], wordId, count);
+    MaxDepth = std::max(MaxDepth, uint32_t(word.Len));
+    return true;
+}
+
+TTrieMatches TTrie::Search(const std::wstring& word, size_t maxDist) const {
+    TTrieMatches result;
+    if (WordIdsView.Empty()) {
+        return result;
+    }
+    // no distance exceeds the longer of the two words, and no branch goes
+    // deeper than the longest word or word.size() + maxDist
+    maxDist = std::min(maxDist, std::max(word.size(), size_t(MaxDepth)));
+    if (word.size() > MaxDepth + maxDist) {
+        return result;
+    }
+    size_t columns = word.size() + 1;
+    size_t depths = std::min(word.size() + maxDist, size_t(MaxDepth)) + 2;
+    std::vector<size_t> rows(depths * columns);
+    for (size_t j = 0; j < columns; ++j) {
+        rows[j] = j;
+    }
+    SearchNode(ROOT, 1, 0, word, maxDist, rows, result);
+    return result;
+}
+
+void TTrie::SearchNode(uint32_t node, size_t depth, wchar_t prevLetter, const std::wstring& word,
+                       size_t maxDist, std::vector<size_t>& rows, TTrieMatches& result) const
+{
+    size_t columns = word.size() + 1;
+    if ((depth + 1) * columns > rows.size()) {
+        return;
+    }
+    const size_t* prevPrev = depth > 1 ? &rows[(depth - 2) * columns] : nullptr;
+    const size_t* prev = &rows[(depth - 1) * columns];
+    size_t* curr = &rows[depth * columns];
+
+    for (size_t c = 0; c < Letters.size(); ++c) {
+        uint32_t child = GetChild(node, c);
+        if (child == ROOT) {
+            continue;
+        }
+        wchar_t letter = Letters[c];
+        curr[0] = prev[0] + 1;
+        size_t rowMin = curr[0];
+        for (size_t j = 1; j < columns; ++j) {
+            size_t cost = letter == word[j - 1] ? 0 : 1;
+            size_t d = std::min(std::min(curr[j - 1] + 1, prev[j] + 1), prev[j - 1] + cost);
+            if (prevPrev && j > 1 && letter == word[j - 2] && prevLetter == word[j - 1]) {
+                d = std::min(d, prevPrev[j - 2] + 1);
+            }
+            curr[j] = d;
+            rowMin = std::min(rowMin, d);
+        }
+        if (curr[columns - 1] <= maxDist && IsWord(child)) {
+            result.push_back({WordIdsView[child], WordCountsView[child], curr[columns - 1]});
+        }
+        if (rowMin <= maxDist) {
+            SearchNode(child, depth + 1, letter, word, maxDist, rows, result);
+        }
+    }
+}
+
+size_t TTrie::NodesNumber() const {
+    return WordIdsView.Size;
+}
+
+void TTrie::Clear() {
+    Letters.clear();
+    LetterIndex.clear();
+    Children.clear();
+    Terminals.clear();
+    WordIds.clear();
+    WordCounts.clear();
+    Path.clear();
+    MaxDepth = 0;
+    UpdateViews();
+}
+
+void TTrie::SaveImage(TModelImageWriter& image) const {
+    image.AddPacked(MIS_TRIE_PARAMS, MaxDepth);
+    image.Add(MIS_TRIE_LETTERS, TArrayRef<wchar_t>(Letters));
+    image.Add(MIS_TRIE_CHILDREN, ChildrenView);
+    image.Add(MIS_TRIE_TERMINALS, TerminalsView);
+    image.Add(MIS_TRIE_WORD_IDS, WordIdsView);
+    image.Add(MIS_TRIE_WORD_COUNTS, WordCountsView);
+}
+
+bool TTrie::LoadImage(const TModelImage& image) {
+    Clear();
+    image.LoadPacked(MIS_TRIE_PARAMS, MaxDepth);
+    TArrayRef<wchar_t> letters = image.Get<wchar_t>(MIS_TRIE_LETTERS);
+    Letters.assign(letters.Data, letters.Data + letters.Size);
+    for (size_t i = 0; i < Letters.size(); ++i) {
+        LetterIndex[Letters[i]] = i;
+    }
+    ChildrenView = image.Get<uint8_t>(MIS_TRIE_CHILDREN);
+    TerminalsView = image.Get<uint8_t>(MIS_TRIE_TERMINALS);
+    WordIdsView = image.Get<uint32_t>(MIS_TRIE_WORD_IDS);
+    WordCountsView = image.Get<uint32_t>(MIS_TRIE_WORD_COUNTS);
+    size_t nodes = WordIdsView.Size;
+    if (ChildrenView.Size != nodes * Letters.size() * CHILD_SIZE ||
+        TerminalsView.Size != (nodes + 7) / 8 ||
+        WordCountsView.Size != nodes)
+    {
+        Clear();
+        return false;
+    }
+    return true;
+}
+
+uint32_t TTrie::AddNode() {
+    uint32_t node = WordIds.size();
+    if (node >= TRIE_MAX_NODES) {
+        return ROOT;
+    }
+    Children.resize(Children.size() + Letters.size() * CHILD_SIZE, 0);
+    if (node % 8 == 0) {
+        Terminals.push_back(0);
+    }
+    WordIds.push_back(TRIE_NO_WORD);
+    WordCounts.push_back(0);
+    UpdateViews();
+    return node;
+}
+
+void TTrie::UpdateViews() {
+    ChildrenView = Children;
+    TerminalsView = Terminals;
+    WordIdsView = WordIds;
+    WordCountsView = WordCounts;
+}
+
+uint32_t TTrie::GetChild(uint32_t node, size_t letter) const {
+    const uint8_t* p = &ChildrenView[(size_t(node) * Letters.size() + letter) * CHILD_SIZE];
+    return uint32_t(p[0]) | (uint32_t(p[1]) << 8) | (uint32_t(p[2]) << 16);
+}
+
+// returns ROOT if the trie is full
+uint32_t TTrie::GetOrAddChild(uint32_t node, size_t letter) {
+    uint32_t child = GetChild(node, letter);
+    if (child != ROOT) {
+        return child;
+    }
+    child = AddNode();
+    if (child == ROOT) {
+        return ROOT;
+    }
+    uint8_t* p = &Children[(size_t(node) * Letters.size() + letter) * CHILD_SIZE];
+    p[0] = child & 0xFF;
+    p[1] = (child >> 8) & 0xFF;
+    p[2] = (child >> 16) & 0xFF;
+    return child;
+}
+
+void TTrie::SetWord(uint32_t node, uint32_t wordId, uint32_t count) {
+    Terminals[node / 8] |= uint8_t(1 << (node % 8));
+    WordIds[node] = wordId;
+    WordCounts[node] = count;
+}
+
+bool TTrie::IsWord(uint32_t node) const {
+    return TerminalsView[node / 8] & (1 << (node % 8));
+}
+
+} // NJamSpell
@@ -0,0 +1,67 @@
+#pragma once
+
+#include <string>
+#include <vector>
+#include <utility>
+#include <unordered_map>
+#include <unordered_set>
+#include <limits>
+
+#include "utils.hpp"
+#include "model_image.hpp"
+
+namespace NJamSpell {
+
+constexpr uint32_t TRIE_NO_WORD = std::numeric_limits<uint32_t>::max();
+constexpr uint32_t TRIE_MAX_NODES = 1 << 24; // child indices are packed into 3 bytes
+
+struct TTrieMatch {
+    uint32_t WordId;
+    uint32_t Count;
+    size_t Distance;
+};
+
+using TTrieMatches = std::vector<TTrieMatch>;
+
+// Dictionary trie stored as a (nodes x alphabet) matrix of 24-bit child
+// indices, with per-node data kept in separate arrays (terminal bitset,
+// word ids, word counts) so the search only touches what it needs.
+// Search walks it with Levenshtein rows (transpositions included) and
+// prunes branches whose row minimum already exceeds the allowed distance.
+// Lookups go through array views, so a trie loaded from a model image is
+// used in place; such a trie is read-only.
+class TTrie {
+public:
+    void Init(const std::unordered_set<wchar_t>& alphabet);
+    bool Insert(const std::wstring& word, uint32_t wordId, uint32_t count = 0);
+    bool Append(const TWord& word, size_t lcp, uint32_t wordId, uint32_t count = 0);
+    TTrieMatches Search(const std::wstring& word, size_t maxDist) const;
+    size_t NodesNumber() const;
+    void Clear();
+    void SaveImage(TModelImageWriter& image) const;
+    bool LoadImage(const TModelImage& image);
+private:
+    uint32_t AddNode();
+    void UpdateViews();
+    uint32_t GetChild(uint32_t node, size_t letter) const;
+    uint32_t GetOrAddChild(uint32_t node, size_t letter);
+    void SetWord(uint32_t node, uint32_t wordId, uint32_t count);
+    bool IsWord(uint32_t node) const;
+    void SearchNode(uint32_t node, size_t depth, wchar_t prevLetter, const std::wstring& word,
+                    size_t maxDist, std::vector<size_t>& rows, TTrieMatches& result) const;
+private:
+    std::vector<wchar_t> Letters;
+    std::unordered_map<wchar_t, uint32_t> LetterIndex;
+    std::vector<uint8_t> Children;    // 3-byte child index per (node, letter), 0 - no child (root is never a child)
+    std::vector<uint8_t> Terminals;   // bit per node, set if a word ends there
+    std::vector<uint32_t> WordIds;    // word id per node, TRIE_NO_WORD if no word ends here
+    std::vector<uint32_t> WordCounts; // word count per node
+    std::vector<uint32_t> Path;       // nodes along the last appended word, Path[0] is root
+    uint32_t MaxDepth = 0;            // length of the longest word
+    TArrayRef<uint8_t> ChildrenView;
+    TArrayRef<uint8_t> TerminalsView;
+    TArrayRef<uint32_t> WordIdsView;
+    TArrayRef<uint32_t> WordCountsView;
+};
+
+} // NJamSpell
@@ -109,12 +109,16 @@ const std::unordered_set<wchar_t>& TTokenizer::GetAlphabet() const {
 }
 
 std::wstring UTF8ToWide(const std::string& text) {
+    return UTF8ToWide(text.data(), text.data() + text.size());
+}
+
+std::wstring UTF8ToWide(const char* begin, const char* end) {
 #ifdef USE_BOOST_CONVERT
     using boost::locale::conv::utf_to_utf;
-    return utf_to_utf<wchar_t>(text.c_str(), text.c_str() + text.size());
+    return utf_to_utf<wchar_t>(begin, end);
 #else
     std::wstring_convert<std::codecvt_utf8_utf16<wchar_t, 0x10ffff, std::little_endian>> converter;
-    return converter.from_bytes(text);
+    return converter.from_bytes(begin, end);
 #endif
 }
 
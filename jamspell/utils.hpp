@@ -46,10 +46,59 @@ public:
   }
 };
 
+// Read-only view of a contiguous array, either a vector's buffer
+// or a section of a memory mapped model image.
+template<typename T>
+struct TArrayRef {
+    TArrayRef() = default;
+    TArrayRef(const T* data, size_t size)
+        : Data(data)
+        , Size(size)
+    {
+    }
+    TArrayRef(const std::vector<T>& vec)
+        : Data(vec.data())
+        , Size(vec.size())
+    {
+    }
+    const T& operator[](size_t i) const {
+        return Data[i];
+    }
+    bool Empty() const {
+        return Size == 0;
+    }
+    const T* Data = nullptr;
+    size_t Size = 0;
+};
+
 using TWords = std::vector<TWord>;
 using TScoredWords = std::vector<TScoredWord>;
 using TSentences = std::vector<TWords>;
 
+// Per-thread free list of scratch vectors: Get() hands out a recycled empty
+// vector when one is available, Release() keeps up to MaxSize buffers for reuse.
+template<typename T, size_t MaxSize = 10>
+class TVectorPool {
+public:
+    std::vector<T> Get() {
+        if (Free.empty()) {
+            return std::vector<T>();
+        }
+        std::vector<T> result = std::move(Free.back());
+        Free.pop_back();
+        return result;
+    }
+    void Release(std::vector<T>&& vec) {
+        if (Free.size() >= MaxSize || vec.capacity() == 0) {
+            return;
+        }
+        vec.clear();
+        Free.push_back(std::move(vec));
+    }
+private:
+    std::vector<std::vector<T>> Free;
+};
+
 class TTokenizer {
     public:
         TTokenizer();
@@ -68,6 +117,7 @@ class TTokenizer {
 std::string LoadFile(const std::string& fileName);
 void SaveFile(const std::string& fileName, const std::string& data);
 std::wstring UTF8ToWide(const std::string& text);
+std::wstring UTF8ToWide(const char* begin, const char* end);
 std::string WideToUTF8(const std::wstring& text);
 uint64_t GetCurrentTimeMs();
 void ToLower(std::wstring& text);
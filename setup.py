@@ -20,11 +20,13 @@ jamspell = Extension(
         os.path.join('jamspell', 'utils.cpp'),
         os.path.join('jamspell', 'perfect_hash.cpp'),
         os.path.join('jamspell', 'bloom_filter.cpp'),
+        os.path.join('jamspell', 'trie.cpp'),
+        os.path.join('jamspell', 'model_image.cpp'),
         os.path.join('contrib', 'cityhash', 'city.cc'),
         os.path.join('contrib', 'phf', 'phf.cc'),
         os.path.join('jamspell.i'),
     ],
-    extra_compile_args=['-std=c++11', '-O2'],
+    extra_compile_args=['-std=c++14', '-O2'],
     swig_opts=['-c++'],
 )
 
@@ -39,11 +41,11 @@ class CustomInstall(install):
         self.run_command('build_ext')
         self.do_egg_install()
 
-class Swig3Ext(build_ext):
+class Swig4Ext(build_ext):
     def find_swig(self):
-        swigBinary = find_executable('swig3.0') or find_executable('swig')
+        swigBinary = find_executable('swig4.0') or find_executable('swig')
         assert swigBinary is not None
-        assert subprocess.check_output([swigBinary, "-version"]).find(b'SWIG Version 3') != -1
+        assert subprocess.check_output([swigBinary, "-version"]).find(b'SWIG Version 4') != -1
         return swigBinary
 
 VERSION = '1.0.0'
@@ -69,7 +71,7 @@ setup(
     long_description='context-based spell checker',
     keywords=['nlp', 'spell', 'spell-checker', 'jamspell', 'hankai'],
     classifiers=[
-        'Programming Language :: Python :: 2.7',
+        'Programming Language :: Python :: 3',
         'License :: OSI Approved :: MIT License',
     ],
     ## TODO Update to be "medSpellCheck"
@@ -79,7 +81,7 @@ setup(
     cmdclass={
         'build': CustomBuild,
         'install': CustomInstall,
-        'build_ext': Swig3Ext,
+        'build_ext': Swig4Ext,
     },
     include_package_data=True,
 )
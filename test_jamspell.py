@@ -1,4 +1,6 @@
 import os
+import json
+import threading
 import jamspell
 import pytest
 from evaluate import generate_dataset
@@ -13,14 +15,18 @@ def removeFile(fname):
 
 TEMP_MODEL = 'temp_model.bin'
 TEMP_SPELL = 'temp_model.bin.spell'
+TEMP_IMAGE = 'temp_model.bin.mmap'
 TEMP = 'temp'
 TEMP_TEST = TEMP + '_test.txt'
 TEMP_TRAIN = TEMP + '_train.txt'
 TEST_DATA = 'test_data/'
+SMALL_TEXT = TEST_DATA + 'input.txt'
+ALPHABET_EN = TEST_DATA + 'alphabet_en.txt'
 
 def teardown_module(module):
     removeFile(TEMP_MODEL)
     removeFile(TEMP_SPELL)
+    removeFile(TEMP_IMAGE)
     removeFile(TEMP_TEST)
     removeFile(TEMP_TRAIN)
 
@@ -40,3 +46,149 @@ def test_evaluation(sourceFile, alphabetFile, expected):
     trainLangModel(TEMP_TRAIN, alphabetFile, TEMP_MODEL)
     results = evaluateJamspell(TEMP_MODEL, TEMP_TEST, alphabetFile)
     assert results == expected
+
+
+def trainSmallModel():
+    corrector = jamspell.TSpellCorrector()
+    assert corrector.TrainLangModel(SMALL_TEXT, ALPHABET_EN, TEMP_MODEL)
+    return corrector
+
+
+def test_trainAndQuery():
+    corrector = trainSmallModel()
+    assert corrector.FixFragment('she has dibetis') == 'she has dibetes'
+    assert corrector.GetCandidates(['she', 'has', 'dibetis'], 2)[0] == 'dibetes'
+
+
+def test_candidatesTrie():
+    corrector = trainSmallModel()
+    assert corrector.GetCandidatesTrie('dibetis', 1) == ('dibetes',)
+    assert corrector.GetCandidatesTrie('xxxxxxxxxx', 2) == ()
+    # any distance past the longest word matches the whole dictionary
+    assert set(corrector.GetCandidatesTrie('abc', 2 ** 40)) == set(corrector.GetCandidatesTrie('abc', 100))
+
+
+def test_modelImage():
+    corrector = trainSmallModel()
+    assert corrector.SaveLangModelMmap(TEMP_IMAGE)
+    mapped = jamspell.TSpellCorrector()
+    assert mapped.LoadLangModelMmap(TEMP_IMAGE)
+    for text in ['she has dibetis', 'a femle with high blod']:
+        assert mapped.FixFragment(text) == corrector.FixFragment(text)
+    assert mapped.GetCandidates(['she', 'has', 'dibetis'], 2) == corrector.GetCandidates(['she', 'has', 'dibetis'], 2)
+    assert mapped.GetCandidatesTrie('dibetis', 2) == corrector.GetCandidatesTrie('dibetis', 2)
+    assert not mapped.LoadLangModelMmap(TEMP_MODEL)
+
+
+def test_trainAfterModelImage():
+    trainSmallModel().SaveLangModelMmap(TEMP_IMAGE)
+    corrector = jamspell.TSpellCorrector()
+    assert corrector.LoadLangModelMmap(TEMP_IMAGE)
+    assert corrector.TrainLangModel(SMALL_TEXT, ALPHABET_EN, TEMP_MODEL)
+    assert corrector.FixFragment('she has dibetis') == 'she has dibetes'
+    assert corrector.GetCandidatesTrie('dibetis', 1) == ('dibetes',)
+
+
+def test_reloadWhileQuerying():
+    corrector = trainSmallModel()
+    errors = []
+
+    def query():
+        try:
+            for i in range(200):
+                assert corrector.FixFragment('she has dibetis %d' % i) == 'she has dibetes %d' % i
+                assert corrector.GetCandidatesTrie('dibetis', 1) == ('dibetes',)
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=query) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for _ in range(10):
+        assert corrector.LoadLangModel(TEMP_MODEL)
+    for t in threads:
+        t.join()
+    assert not errors
+
+
+def test_fixFragmentBytes():
+    corrector = trainSmallModel()
+    assert corrector.FixFragmentBytes(b'she has dibetis') == b'she has dibetes'
+    assert corrector.FixFragmentNormalizedBytes(b'She has dibetis') == b'she has dibetes.'
+    with pytest.raises(ValueError):
+        corrector.FixFragmentBytes(b'\xff\xfe bad')
+    with pytest.raises(TypeError):
+        corrector.FixFragmentBytes('she has dibetis')
+
+
+def test_stringVectorFromSequence():
+    assert list(jamspell.StringVector(['she', 'has'])) == ['she', 'has']
+    assert list(jamspell.StringVector(('dibetes',))) == ['dibetes']
+    assert list(jamspell.StringVector([])) == []
+    with pytest.raises(TypeError):
+        jamspell.StringVector(['she', 1])
+
+
+def test_fragmentCache(monkeypatch):
+    monkeypatch.setattr(jamspell, 'FRAGMENT_CACHE_SIZE', 2)
+    corrector = trainSmallModel()
+    assert corrector.cache_info() == (0, 0, 2, 0)
+
+    assert corrector.FixFragment('she has dibetis') == 'she has dibetes'
+    assert corrector.FixFragment('she has dibetis') == 'she has dibetes'
+    assert corrector.cache_info() == (1, 1, 2, 1)
+
+    # 'a' was used last, so adding 'c' evicts 'b'
+    corrector.FixFragment('a')
+    corrector.FixFragment('b')
+    corrector.FixFragment('a')
+    corrector.FixFragment('c')
+    assert corrector.cache_info() == (2, 4, 2, 2)
+    corrector.FixFragment('a')
+    assert corrector.cache_info().hits == 3
+    corrector.FixFragment('b')
+    assert corrector.cache_info().misses == 5
+
+    # normalized results are cached separately
+    assert corrector.FixFragmentNormalized('she has dibetis') == 'she has dibetes.'
+    assert corrector.cache_info().misses == 6
+
+    corrector.SetPenalty(20.0, 5.0)
+    assert corrector.cache_info() == (0, 0, 2, 0)
+    corrector.FixFragment('a')
+    corrector.SetMaxCandidatesToCheck(14)
+    assert corrector.cache_info().currsize == 0
+    corrector.FixFragment('a')
+    assert corrector.LoadLangModel(TEMP_MODEL)
+    assert corrector.cache_info().currsize == 0
+
+
+def test_fixFragments():
+    corrector = trainSmallModel()
+    texts = ['she has dibetis', 'a femle with high blod', '']
+    expected = tuple(corrector.FixFragment(t) for t in texts)
+    assert corrector.FixFragments(texts) == expected
+    assert corrector.FixFragments(jamspell.StringVector(texts)) == expected
+    assert corrector.FixFragments([]) == ()
+
+
+def test_candidatesJSON():
+    corrector = trainSmallModel()
+    raw = corrector.GetALLCandidatesScoredJSONBytes('she has dibetis')
+    assert isinstance(raw, bytes)
+    results = json.loads(raw)['results']
+    assert results == json.loads(corrector.GetALLCandidatesScoredJSON('she has dibetis'))['results']
+    assert [r['original'] for r in results] == ['dibetis']
+    assert results[0]['candidates'][0]['candidate'] == 'dibetes'
+
+
+def test_stringVectorClear():
+    words = jamspell.StringVector(['she', 'has', 'dibetes'])
+    words.clear_keep_capacity()
+    assert len(words) == 0
+    assert words.capacity() >= 3
+
+    words = jamspell.StringVector(['she', 'has', 'dibetes'])
+    words.clear()
+    assert len(words) == 0
+    assert words.capacity() == 0
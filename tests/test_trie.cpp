@@ -0,0 +1,95 @@
+#include <gtest/gtest.h>
+
+#include <algorithm>
+#include <cstdio>
+
+#include <jamspell/trie.hpp>
+
+static std::vector<uint32_t> MatchedIds(const NJamSpell::TTrieMatches& matches) {
+    std::vector<uint32_t> ids;
+    for (auto&& m: matches) {
+        ids.push_back(m.WordId);
+    }
+    std::sort(ids.begin(), ids.end());
+    return ids;
+}
+
+TEST(TrieTest, basicFlow) {
+    NJamSpell::TTrie trie;
+    trie.Init({L'a', L'b', L'c', L'd', L'e', L't', L's'});
+    ASSERT_TRUE(trie.Insert(L"cat", 0, 5));
+    ASSERT_TRUE(trie.Insert(L"cats", 1));
+    ASSERT_TRUE(trie.Insert(L"bat", 2));
+    ASSERT_TRUE(trie.Insert(L"dab", 3));
+    ASSERT_FALSE(trie.Insert(L"cow", 4));
+
+    ASSERT_EQ(std::vector<uint32_t>({0}), MatchedIds(trie.Search(L"cat", 0)));
+    ASSERT_EQ(std::vector<uint32_t>({0, 1, 2}), MatchedIds(trie.Search(L"cat", 1)));
+    ASSERT_EQ(std::vector<uint32_t>({0}), MatchedIds(trie.Search(L"act", 1)));
+    ASSERT_EQ(std::vector<uint32_t>({0, 1}), MatchedIds(trie.Search(L"cas", 1)));
+    ASSERT_TRUE(trie.Search(L"xyz", 1).empty());
+
+    NJamSpell::TTrieMatches matches = trie.Search(L"cts", 1);
+    ASSERT_EQ(1u, matches.size());
+    ASSERT_EQ(1u, matches[0].WordId);
+    ASSERT_EQ(1u, matches[0].Distance);
+
+    matches = trie.Search(L"cat", 0);
+    ASSERT_EQ(1u, matches.size());
+    ASSERT_EQ(5u, matches[0].Count);
+}
+
+TEST(TrieTest, sortedAppend) {
+    std::vector<std::wstring> words = {L"bat", L"cat", L"cats", L"dab"};
+    std::vector<size_t> lcp = {0, 0, 3, 0};
+
+    NJamSpell::TTrie trie;
+    trie.Init({L'a', L'b', L'c', L'd', L'e', L't', L's'});
+    for (size_t i = 0; i < words.size(); ++i) {
+        ASSERT_TRUE(trie.Append(words[i], lcp[i], i));
+    }
+
+    NJamSpell::TTrie inserted;
+    inserted.Init({L'a', L'b', L'c', L'd', L'e', L't', L's'});
+    for (size_t i = 0; i < words.size(); ++i) {
+        inserted.Insert(words[i], i);
+    }
+
+    ASSERT_EQ(inserted.NodesNumber(), trie.NodesNumber());
+    ASSERT_EQ(std::vector<uint32_t>({1, 2}), MatchedIds(trie.Search(L"cas", 1)));
+    ASSERT_EQ(std::vector<uint32_t>({0, 1, 3}), MatchedIds(trie.Search(L"ba", 2)));
+}
+
+TEST(TrieTest, modelImage) {
+    NJamSpell::TTrie trie;
+    trie.Init({L'a', L'b', L'c', L'd', L'e', L't', L's'});
+    trie.Insert(L"cat", 0, 5);
+    trie.Insert(L"cats", 1);
+    trie.Insert(L"bat", 2);
+
+    NJamSpell::TModelImageWriter writer;
+    trie.SaveImage(writer);
+    ASSERT_TRUE(writer.Save("test_trie.mmap", 42));
+
+    NJamSpell::TModelImage image;
+    ASSERT_TRUE(image.Open("test_trie.mmap"));
+    ASSERT_EQ(42u, image.GetCheckSum());
+    NJamSpell::TTrie mapped;
+    ASSERT_TRUE(mapped.LoadImage(image));
+
+    ASSERT_EQ(trie.NodesNumber(), mapped.NodesNumber());
+    ASSERT_EQ(std::vector<uint32_t>({0, 1, 2}), MatchedIds(mapped.Search(L"cat", 1)));
+    ASSERT_EQ(5u, mapped.Search(L"cat", 0)[0].Count);
+    ASSERT_FALSE(mapped.Insert(L"dab", 3));
+    std::remove("test_trie.mmap");
+}
+
+TEST(TrieTest, largeDistance) {
+    NJamSpell::TTrie trie;
+    trie.Init({L'a', L'b', L'c', L'd', L'e', L't', L's'});
+    trie.Insert(L"cat", 0);
+    trie.Insert(L"cats", 1);
+
+    ASSERT_EQ(std::vector<uint32_t>({0, 1}), MatchedIds(trie.Search(L"dab", size_t(1) << 40)));
+    ASSERT_TRUE(trie.Search(L"bbbbbbbb", 3).empty());
+}
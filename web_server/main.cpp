@@ -16,8 +16,7 @@ std::string GetCandidatesScored(const NJamSpell::TSpellCorrector& corrector,
 std::string FixText(const NJamSpell::TSpellCorrector& corrector,
                     const std::string& text)
 {
-    std::wstring input = NJamSpell::UTF8ToWide(text);
-    return NJamSpell::WideToUTF8(corrector.FixFragment(input));
+    return corrector.FixFragment(text.data(), text.size());
 }
 
 int main(int argc, const char** argv) {
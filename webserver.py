@@ -56,9 +56,8 @@ def candidates():
     runningOffset=0
     if text == "":
         return "No text received. Usage: url/candidates?html=0&limit=2&text=texttomedicalspellcheck"
-    respJSONstring = corrector.GetALLCandidatesScoredJSON(text)
-    print(respJSONstring)
-    rval = json.loads(respJSONstring) 
+    respJSONbytes = corrector.GetALLCandidatesScoredJSONBytes(text)
+    rval = json.loads(respJSONbytes)
     for result in rval['results']:
         result['candidates'] = result['candidates'][:limit]
     if 'results' not in rval.keys() or len(rval['results'])==0: rval['results']='CORRECT'